@@ -0,0 +1,20 @@
+// Cascading filter dropdowns, answered in the browser from the option hierarchy
+// built by build_option_hierarchy() in comprehensive_dashboard.py
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    dropdowns: {
+        brandOptions: function(manufacturer, hierarchy) {
+            var entry = (hierarchy || {})[manufacturer];
+            var brands = entry ? entry.brands : [];
+            return [{label: 'All Brands', value: 'All'}].concat(
+                brands.map(function(brand) { return {label: brand, value: brand}; })
+            );
+        },
+        modelOptions: function(manufacturer, brand, hierarchy) {
+            var entry = (hierarchy || {})[manufacturer];
+            var models = (entry && entry.models[brand]) || [];
+            return [{label: 'All Models', value: 'All'}].concat(
+                models.map(function(model) { return {label: model, value: model}; })
+            );
+        }
+    }
+});
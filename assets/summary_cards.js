@@ -0,0 +1,182 @@
+// Summary cards rendered in the browser; mirrors update_summary_cards() in
+// comprehensive_dashboard.py. The values come from the cube cells built by
+// build_card_cells(), fetched once per dataset from the cells URL, or from the
+// server's values route when the dataset has too many cells to ship.
+(function() {
+    // Query parameter names of the eight filters, in callback argument order
+    var FILTER_PARAMS = ['manufacturer', 'brand', 'model', 'hp_segment',
+                         'import_country', 'destination_country', 'year', 'month'];
+
+    function isActive(value) {
+        return value !== 'All' && value !== null && value !== undefined;
+    }
+
+    function fetchJson(url) {
+        return fetch(url, {credentials: 'same-origin'}).then(function(response) {
+            if (!response.ok) {
+                throw new Error(url + ': HTTP ' + response.status);
+            }
+            return response.json();
+        });
+    }
+
+    // The cells of the current cells URL; the URL changes with the data
+    var cellsUrl = null, cellsRequest = null;
+    function loadCells(url) {
+        if (url !== cellsUrl) {
+            cellsUrl = url;
+            cellsRequest = fetchJson(url);
+        }
+        return cellsRequest;
+    }
+
+    function fetchValues(url, selected) {
+        var query = new URLSearchParams();
+        FILTER_PARAMS.forEach(function(name, i) {
+            if (isActive(selected[i])) {
+                query.append(name, selected[i]);
+            }
+        });
+        return fetchJson(url + '?' + query.toString()).then(function(body) { return body.values; });
+    }
+
+    function component(namespace, type, props) {
+        return {namespace: namespace, type: type, props: props};
+    }
+
+    // Python's '{:,.0f}' formatting (ties round to even)
+    function formatNumber(value) {
+        if (value === null || isNaN(value)) {
+            return 'nan';
+        }
+        var rounded = Math.round(value);
+        if (Math.abs(value % 1) === 0.5 && rounded % 2 !== 0) {
+            rounded -= 1;
+        }
+        return rounded.toLocaleString('en-US');
+    }
+
+    function card(icon, color, value, label) {
+        return component('dash_bootstrap_components', 'Card', {
+            className: 'text-center shadow-sm border-0',
+            style: {'border-radius': '15px'},
+            children: [component('dash_bootstrap_components', 'CardBody', {
+                children: [component('dash_html_components', 'Div', {
+                    className: 'text-center',
+                    children: [
+                        component('dash_html_components', 'I', {className: 'fas ' + icon + ' fa-2x text-' + color + ' mb-3'}),
+                        component('dash_html_components', 'H4', {children: value, className: 'text-' + color + ' mb-2'}),
+                        component('dash_html_components', 'P', {children: label, className: 'mb-0 text-muted'})
+                    ]
+                })]
+            })]
+        });
+    }
+
+    // Card values for a filter state from the cells, or null when no cell matches
+    function cellValues(selected, cells) {
+        // Translate each active filter into the code it must match (-1 matches nothing)
+        var active = [];
+        cells.columns.forEach(function(column, i) {
+            if (isActive(selected[i])) {
+                active.push({codes: cells.codes[column], code: cells.values[column].indexOf(String(selected[i]))});
+            }
+        });
+
+        var measures = cells.measures;
+        var totals = {};
+        Object.keys(measures).forEach(function(measure) { totals[measure] = 0; });
+        var manufacturers = {}, models = {};
+        var manufacturerCodes = cells.codes['Manufacturer Name'];
+        var modelCodes = cells.codes['Model Name'];
+        var matched = 0;
+
+        for (var cell = 0; cell < manufacturerCodes.length; cell++) {
+            var match = true;
+            for (var f = 0; f < active.length; f++) {
+                if (active[f].codes[cell] !== active[f].code) {
+                    match = false;
+                    break;
+                }
+            }
+            if (!match) {
+                continue;
+            }
+            matched++;
+            manufacturers[manufacturerCodes[cell]] = true;
+            models[modelCodes[cell]] = true;
+            for (var measure in totals) {
+                totals[measure] += measures[measure][cell];
+            }
+        }
+
+        if (matched === 0) {
+            return null;
+        }
+
+        function mean(measure) {
+            return totals[measure + '_sum'] / totals[measure + '_count'];
+        }
+
+        return {
+            manufacturers: Object.keys(manufacturers).length,
+            models: Object.keys(models).length,
+            price_min: mean('Price_Min'),
+            price_max: mean('Price_Max'),
+            sales_min: mean('Sales_Min'),
+            sales_max: mean('Sales_Max')
+        };
+    }
+
+    function renderCards(values) {
+        if (values === null) {
+            return component('dash_html_components', 'Div', {children: [
+                component('dash_bootstrap_components', 'Alert', {
+                    children: 'No data matches the selected filters. Please adjust your filter criteria.',
+                    color: 'warning'
+                })
+            ]});
+        }
+
+        var cards = [
+            card('fa-industry', 'success', String(values.manufacturers), 'Manufacturers'),
+            card('fa-tractor', 'info', String(values.models), 'Tractor Models'),
+            card('fa-dollar-sign', 'warning',
+                 '$' + formatNumber(values.price_min) + ' - $' + formatNumber(values.price_max), 'Avg Price Range'),
+            card('fa-chart-line', 'danger',
+                 formatNumber(values.sales_min) + ' - ' + formatNumber(values.sales_max), 'Avg Tractor Unit Monthly Sales')
+        ];
+        return component('dash_bootstrap_components', 'Row', {
+            justify: 'center',
+            children: cards.map(function(c) {
+                return component('dash_bootstrap_components', 'Col', {children: c, width: 3, className: 'mb-3'});
+            })
+        });
+    }
+
+    // Returns a promise of the cards; Dash waits for it
+    function render() {
+        var selected = Array.prototype.slice.call(arguments, 0, 8);
+        var urls = arguments[8];
+        if (!urls) {
+            return window.dash_clientside.no_update;
+        }
+        var values;
+        if (urls.cells) {
+            values = loadCells(urls.cells).then(function(cells) {
+                return cellValues(selected, cells);
+            }, function() {
+                // Cells replaced by a newer dataset, for example; ask the server instead
+                cellsUrl = null;
+                return fetchValues(urls.values, selected);
+            });
+        } else {
+            values = fetchValues(urls.values, selected);
+        }
+        return values.then(renderCards);
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        summaryCards: {render: render}
+    });
+})();
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the comprehensive dashboard's filter, callback and export hot paths
+
+Generates datasets of 10K, 1M and 10M rows with the dummy data generator,
+times each hot path on every size and writes the results as JSON. Pass a
+previous results file with --compare to flag regressions.
+
+    python benchmark_comprehensive_dashboard.py --sizes 10000 1000000 --output results.json
+    python benchmark_comprehensive_dashboard.py --compare results.json
+"""
+
+import argparse
+import gc
+import json
+import math
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import comprehensive_dashboard as dashboard
+
+DEFAULT_SIZES = [10_000, 1_000_000, 10_000_000]
+
+# A case is flagged when it is this much slower than in the baseline, and
+# by at least DEFAULT_MIN_DELTA seconds so sub-millisecond noise is ignored
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA = 0.005
+
+# Excel export is benchmarked on at most this many rows; openpyxl writes a
+# few thousand rows per second, so a full 10M-row sheet set is not a useful
+# measurement
+EXCEL_BENCHMARK_ROWS = 20_000
+
+def generate_dataset(n_rows, seed=0):
+    """Dummy dataset with roughly `n_rows` rows, in the schema the dashboard loads"""
+    rng = dashboard.np.random.default_rng(seed)
+    n_months = 24  # the generator's default span, 2024-01 to 2025-12
+    frame = dashboard.create_comprehensive_dummy_data(rng=rng, n_base_rows=math.ceil(n_rows / n_months))
+    return dashboard.compact_schema(frame) if dashboard.COMPACT_SCHEMA else frame
+
+def filter_combinations(frame):
+    """Representative filter states, from unfiltered to highly selective"""
+    first = frame.iloc[0]
+    everything = ['All'] * len(dashboard.FILTER_COLUMNS)
+
+    def state(**values):
+        filters = list(everything)
+        for column, value in values.items():
+            filters[dashboard.FILTER_COLUMNS.index(column)] = value
+        return tuple(filters)
+
+    return {
+        'all': state(),
+        'manufacturer': state(**{'Manufacturer Name': str(first['Manufacturer Name'])}),
+        'manufacturer_year': state(**{'Manufacturer Name': str(first['Manufacturer Name']), 'Year': int(first['Year'])}),
+        'year_month': state(Year=int(first['Year']), Month=int(first['Month'])),
+        'model_month': state(**{'Model Name': str(first['Model Name']), 'Month': int(first['Month'])}),
+        'segment_countries': state(**{'HP Segment': str(first['HP Segment']),
+                                      'Imported From (Country Name)': str(first['Imported From (Country Name)']),
+                                      'End Destination Country': str(first['End Destination Country'])}),
+    }
+
+def clear_caches():
+    """Drop every selection, table and figure cache so each timing starts cold"""
+    dashboard.select_index_rows.cache_clear()
+    dashboard._query_table_rows.cache_clear()
+    dashboard.figure_cache.clear()
+
+def measure(function, repeat=3):
+    """Best wall time of `function` over `repeat` cold runs, then its peak traced memory in one more run"""
+    timings = []
+    for _ in range(repeat):
+        clear_caches()
+        gc.collect()
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+
+    clear_caches()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak
+
+def selected_count(frame, positions):
+    return len(frame) if positions is None else len(positions)
+
+def benchmark_size(n_rows, repeat=3):
+    """Time every hot path on a generated dataset of about `n_rows` rows"""
+    results = []
+
+    def record(case, function, rows):
+        seconds, peak = measure(function, repeat)
+        results.append({
+            'size': n_rows,
+            'case': case,
+            'seconds': seconds,
+            'rows': rows,
+            'rows_per_second': rows / seconds if seconds > 0 else None,
+            'peak_bytes': peak,
+        })
+        print(f"  {case:<40} {seconds * 1000:10.2f} ms  {rows:>12,} rows  {peak / 1e6:9.1f} MB peak")
+
+    started = time.perf_counter()
+    frame = generate_dataset(n_rows)
+    generated = time.perf_counter() - started
+    results.append({'size': n_rows, 'case': 'generate', 'seconds': generated, 'rows': len(frame),
+                    'rows_per_second': len(frame) / generated, 'peak_bytes': None})
+    print(f"{len(frame):,} rows (generated in {generated:.2f}s)")
+
+    started = time.perf_counter()
+    dashboard.set_dataset(frame)
+    indexed = time.perf_counter() - started
+    results.append({'size': n_rows, 'case': 'index_and_cube', 'seconds': indexed, 'rows': len(frame),
+                    'rows_per_second': len(frame) / indexed, 'peak_bytes': None})
+
+    combinations = filter_combinations(frame)
+    for name, filters in combinations.items():
+        matched = selected_count(frame, dashboard.filter_index.select(*filters))
+        record(f'apply_filters[{name}]', lambda: dashboard.apply_filters(frame, *filters), matched)
+
+    for name in ('all', 'manufacturer_year', 'model_month'):
+        filters = combinations[name]
+        matched = selected_count(frame, dashboard.filter_index.select(*filters))
+        record(f'update_summary_cards[{name}]', lambda: dashboard.update_summary_cards(*filters), matched)
+        record(f'update_charts[{name}]', lambda: dashboard.update_charts(*filters), matched)
+        record(f'update_data_table[{name}]', lambda: dashboard.update_data_table(*filters), matched)
+        record(f'update_data_table_sorted[{name}]', lambda: dashboard.update_data_table(
+            *filters, sort_by=[{'column_id': 'Price_Min', 'direction': 'desc'}]), matched)
+        record(f'update_export_links[{name}]', lambda: dashboard.update_export_links(*filters), matched)
+
+    manufacturer = combinations['manufacturer'][0]
+    record('update_brand_dropdown', lambda: dashboard.update_brand_dropdown(manufacturer), 0)
+    record('update_model_dropdown', lambda: dashboard.update_model_dropdown(manufacturer, 'All'), 0)
+
+    def export_csv():
+        for _ in dashboard.iter_csv(frame, None):
+            pass
+    record('export_csv[all]', export_csv, len(frame))
+
+    excel_positions = dashboard.np.arange(min(len(frame), EXCEL_BENCHMARK_ROWS))
+
+    def export_excel():
+        with tempfile.TemporaryFile() as output:
+            dashboard.write_excel(frame, excel_positions, output)
+    record('export_excel[capped]', export_excel, len(excel_positions))
+
+    return results
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat=3):
+    """Benchmark every size and return the results document.
+
+    The dashboard's own dataset is restored afterwards if one was loaded.
+    """
+    previous = dashboard.df if dashboard.dataset_version else None
+    try:
+        results = []
+        for n_rows in sizes:
+            results.extend(benchmark_size(n_rows, repeat))
+    finally:
+        if previous is not None:
+            dashboard.set_dataset(previous)
+
+    return {'meta': run_metadata(repeat), 'results': results}
+
+def run_metadata(repeat):
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pandas': dashboard.pd.__version__,
+        'compact_schema': dashboard.COMPACT_SCHEMA,
+        'repeat': repeat,
+    }
+
+def find_regressions(current, baseline, threshold=DEFAULT_THRESHOLD, min_delta=DEFAULT_MIN_DELTA):
+    """Cases in `current` slower than the same size and case in `baseline`.
+
+    A case regresses when it is slower by more than the fraction `threshold`
+    and by more than `min_delta` seconds.
+    """
+    previous = {(r['size'], r['case']): r['seconds'] for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        before = previous.get((result['size'], result['case']))
+        if (before and result['seconds'] > before * (1 + threshold)
+                and result['seconds'] - before > min_delta):
+            regressions.append({'size': result['size'], 'case': result['case'],
+                                'baseline_seconds': before, 'seconds': result['seconds'],
+                                'slowdown': result['seconds'] / before})
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the comprehensive dashboard hot paths")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="dataset sizes in rows")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per case (the best is kept)")
+    parser.add_argument('--output', default=f"benchmark-{datetime.now():%Y%m%d-%H%M%S}.json",
+                        help="where to write the JSON results")
+    parser.add_argument('--compare', help="previous results file to check for regressions")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown against --compare before a case is flagged")
+    parser.add_argument('--min-delta', type=float, default=DEFAULT_MIN_DELTA,
+                        help="smallest slowdown in seconds that is flagged")
+    args = parser.parse_args()
+
+    print("Comprehensive Tractor Dashboard - Benchmarks")
+    print("=" * 60)
+    report = run_benchmarks(args.sizes, args.repeat)
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(report, baseline, args.threshold, args.min_delta)
+        for r in regressions:
+            print(f"✗ {r['case']} at {r['size']:,} rows: {r['baseline_seconds'] * 1000:.2f} ms -> "
+                  f"{r['seconds'] * 1000:.2f} ms ({r['slowdown']:.2f}x)")
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.compare}")
+            sys.exit(1)
+        print(f"\n✓ No regressions against {args.compare}")
@@ -1,14 +1,32 @@
 import dash
-from dash import dcc, html, Input, Output, callback, dash_table
-import plotly.graph_objects as go
-import plotly.express as px
+from dash import dcc, html, Input, Output, State, ClientsideFunction, callback, ctx, dash_table
 import pandas as pd
 import dash_bootstrap_components as dbc
+from flask import Response, g, has_request_context, request, send_file, stream_with_context
 from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlencode
+import cProfile
+import gzip
+import hashlib
+import hmac
+import json
+import logging
 import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
 import numpy as np
-import base64
-import io
+
+logger = logging.getLogger(__name__)
 
 # Initialize the Dash app with Bootstrap theme and Font Awesome
 app = dash.Dash(__name__, external_stylesheets=[
@@ -16,14 +34,384 @@ app = dash.Dash(__name__, external_stylesheets=[
     "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css"
 ])
 app.title = "Dashboard – Japan Agricultural Tractor Tracker"
+# WSGI entry point for gunicorn (see gunicorn.conf.py)
+server = app.server
 
 # Add health check endpoint for deployment monitoring
 @app.server.route('/health')
 def health_check():
     return {'status': 'healthy', 'service': 'japan-tractor-tracker'}, 200
 
-def create_comprehensive_dummy_data():
-    """Create comprehensive dummy data based on the provided tractor data structure"""
+# Request metrics: per-callback and per-route latency, rows selected and response size.
+# Counters are per process; with several gunicorn workers each scrape sees one worker.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class RequestMetrics:
+    """Thread-safe latency histograms and row/byte counters, keyed by handler name"""
+    
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._series = {}
+    
+    def observe(self, name, seconds, rows=None, size=None, saved=None):
+        """Record one call of `name` taking `seconds`, selecting `rows` and returning `size` bytes.
+
+        `saved` is how many bytes compression took off the response.
+        """
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = {'buckets': [0] * len(self.buckets), 'count': 0,
+                                               'seconds': 0.0, 'rows': 0, 'bytes': 0, 'saved': 0}
+            series['count'] += 1
+            series['seconds'] += seconds
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series['buckets'][i] += 1
+            if rows is not None:
+                series['rows'] += int(rows)
+            if size is not None:
+                series['bytes'] += int(size)
+            if saved is not None:
+                series['saved'] += int(saved)
+    
+    def snapshot(self):
+        """Copy of every series, for reporting"""
+        with self._lock:
+            return {name: dict(series, buckets=list(series['buckets']))
+                    for name, series in self._series.items()}
+    
+    def render(self):
+        """The metrics in Prometheus text exposition format"""
+        series = sorted(self.snapshot().items())
+        lines = ['# HELP dashboard_request_seconds Wall time per Dash callback, route or filter step.',
+                 '# TYPE dashboard_request_seconds histogram']
+        for name, values in series:
+            for bound, count in zip(self.buckets, values['buckets']):
+                lines.append(f'dashboard_request_seconds_bucket{{handler="{name}",le="{bound}"}} {count}')
+            lines.append(f'dashboard_request_seconds_bucket{{handler="{name}",le="+Inf"}} {values["count"]}')
+            lines.append(f'dashboard_request_seconds_sum{{handler="{name}"}} {values["seconds"]:.6f}')
+            lines.append(f'dashboard_request_seconds_count{{handler="{name}"}} {values["count"]}')
+        lines += ['# HELP dashboard_rows_selected_total Dataset rows matched by the filters.',
+                  '# TYPE dashboard_rows_selected_total counter']
+        lines += [f'dashboard_rows_selected_total{{handler="{name}"}} {values["rows"]}' for name, values in series]
+        lines += ['# HELP dashboard_response_bytes_total Response body bytes sent.',
+                  '# TYPE dashboard_response_bytes_total counter']
+        lines += [f'dashboard_response_bytes_total{{handler="{name}"}} {values["bytes"]}' for name, values in series]
+        lines += ['# HELP dashboard_response_bytes_saved_total Response bytes saved by compression.',
+                  '# TYPE dashboard_response_bytes_saved_total counter']
+        lines += [f'dashboard_response_bytes_saved_total{{handler="{name}"}} {values["saved"]}' for name, values in series]
+        return '\n'.join(lines) + '\n'
+
+request_metrics = RequestMetrics()
+
+# Optional cProfile sampling: profile this fraction of requests and keep the
+# profiles of those slower than PROFILE_SLOW_SECONDS in PROFILE_DIR
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+PROFILE_SLOW_SECONDS = float(os.environ.get('PROFILE_SLOW_SECONDS', 1.0))
+PROFILE_DIR = os.environ.get('PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'tractor-profiles'))
+# cProfile can only run one profiler at a time
+_profile_lock = threading.Lock()
+
+def request_handler_name():
+    """Metrics name for the current request: the Dash callback function or the route's view function.
+
+    None for requests not served by this module (Dash's own routes, assets).
+    """
+    if request.path.endswith('/_dash-update-component'):
+        body = request.get_json(silent=True) or {}
+        callback = app.callback_map.get(body.get('output'), {}).get('callback')
+        return getattr(callback, '__name__', 'unknown_callback')
+    view = app.server.view_functions.get(request.endpoint)
+    if view is not None and view.__module__ == __name__:
+        return request.endpoint
+    return None
+
+def note_rows(n_rows):
+    """Record how many dataset rows the current request's filters selected"""
+    if has_request_context():
+        g.metrics_rows = n_rows
+
+@app.server.before_request
+def start_request_metrics():
+    g.metrics_handler = request_handler_name()
+    if g.metrics_handler is None:
+        return
+    g.metrics_started = time.perf_counter()
+    if PROFILE_SAMPLE_RATE and random.random() < PROFILE_SAMPLE_RATE and _profile_lock.acquire(blocking=False):
+        g.metrics_profile = cProfile.Profile()
+        g.metrics_profile.enable()
+
+def _finish_profile(name, seconds):
+    profile = g.pop('metrics_profile', None)
+    if profile is None:
+        return
+    profile.disable()
+    _profile_lock.release()
+    if seconds >= PROFILE_SLOW_SECONDS:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = os.path.join(PROFILE_DIR, f"{name}-{int(time.time() * 1000)}.prof")
+        profile.dump_stats(path)
+        logger.info("Slow request %s took %.2fs; profile written to %s", name, seconds, path)
+
+def _metered(chunks, name, started, rows):
+    """Pass a streamed body through, recording its size and duration once it is sent"""
+    size = 0
+    try:
+        for chunk in chunks:
+            size += len(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+            yield chunk
+    finally:
+        # The server closes this generator, not the body; close it as the server would have
+        if hasattr(chunks, 'close'):
+            chunks.close()
+        request_metrics.observe(name, time.perf_counter() - started, rows, size)
+
+@app.server.after_request
+def record_request_metrics(response):
+    name = g.get('metrics_handler')
+    if name is None:
+        return response
+    elapsed = time.perf_counter() - g.metrics_started
+    _finish_profile(name, elapsed)
+    rows = g.get('metrics_rows')
+    if response.is_streamed and response.content_length is None:
+        # Recorded when the last chunk has been sent
+        response.response = _metered(response.response, name, g.metrics_started, rows)
+    else:
+        request_metrics.observe(name, elapsed, rows, response.content_length, g.get('compression_saved'))
+    return response
+
+@app.server.route('/metrics')
+def metrics():
+    """Request metrics plus cache and dataset gauges, in Prometheus text format"""
+    lines = [request_metrics.render()]
+    for name, cache in (('figure', figure_cache.stats()), ('export', export_cache.stats())):
+        for stat, kind in (('hits', 'counter'), ('misses', 'counter'), ('evictions', 'counter'),
+                           ('entries', 'gauge'), ('bytes', 'gauge')):
+            metric = f"dashboard_{name}_cache_{stat}{'_total' if kind == 'counter' else ''}"
+            lines.append(f"# TYPE {metric} {kind}\n{metric} {cache[stat]}\n")
+    lines.append(f"# TYPE dashboard_dataset_version gauge\ndashboard_dataset_version {dataset_version}\n")
+    if dataset_version:
+        lines.append(f"# TYPE dashboard_dataset_rows gauge\ndashboard_dataset_rows {len(df)}\n")
+        cubes = rollups.stats()
+        for stat, kind in (('evictions', 'counter'), ('entries', 'gauge'), ('bytes', 'gauge')):
+            metric = f"dashboard_rollup_cache_{stat}{'_total' if kind == 'counter' else ''}"
+            lines.append(f"# TYPE {metric} {kind}\n{metric} {cubes[stat]}\n")
+    return Response(''.join(lines), mimetype='text/plain; version=0.0.4')
+
+# Response compression: callback, layout and page responses are gzipped for
+# clients that accept it. Registered after record_request_metrics so it runs
+# first (Flask runs after_request hooks in reverse) and the metrics see both
+# sizes. Streamed and file responses (exports, Dash's own assets) are left to
+# their routes or a proxy.
+COMPRESS_RESPONSES = os.environ.get('COMPRESS_RESPONSES', '1') != '0'
+COMPRESS_MIN_BYTES = int(os.environ.get('COMPRESS_MIN_BYTES', 1024))
+COMPRESS_LEVEL = 6
+COMPRESS_MIMETYPES = {'application/json', 'text/html', 'text/plain'}
+
+@app.server.after_request
+def compress_response(response):
+    if (not COMPRESS_RESPONSES or response.status_code != 200 or response.direct_passthrough
+            or response.is_streamed or response.mimetype not in COMPRESS_MIMETYPES
+            or 'Content-Encoding' in response.headers or 'ETag' in response.headers
+            or not request.accept_encodings['gzip']):
+        return response
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_BYTES:
+        return response
+    compressed = gzip.compress(data, compresslevel=COMPRESS_LEVEL, mtime=0)
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    g.compression_saved = len(data) - len(compressed)
+    return response
+
+# Formatted range columns; derived from the numeric fields only where they are shown
+PRICE_TEXT_COLUMN = 'Dollar Value of Tractor (ASP Range in US$)'
+SALES_TEXT_COLUMN = 'Monthly Sale Data (Units)'
+
+_NUMBER_PATTERN = re.compile(r'\d[\d,]*(?:\.\d+)?')
+
+def parse_range(text):
+    """Parse range text such as '$12,000 - $26,900', '300–450' or '28HP' into (low, high)"""
+    numbers = [float(match.replace(',', '')) for match in _NUMBER_PATTERN.findall(str(text))]
+    if not numbers:
+        return (np.nan, np.nan)
+    return (numbers[0], numbers[1] if len(numbers) > 1 else numbers[0])
+
+# Column layout of the source sheet (last_sheet_clean.csv) and of the built-in catalogue
+RAW_COLUMNS = [
+    'Manufacturer Name', 'Brand Name', 'Model Name', 'HP Segment',
+    PRICE_TEXT_COLUMN, SALES_TEXT_COLUMN,
+    'Imported From (Country Name)', 'End Destination Country'
+]
+DIMENSION_COLUMNS = [
+    'Manufacturer Name', 'Brand Name', 'Model Name', 'HP Segment',
+    'Imported From (Country Name)', 'End Destination Country'
+]
+
+# Data table: displayed columns, and the numeric columns behind the formatted range text
+TABLE_COLUMNS = [
+    'Manufacturer Name', 'Brand Name', 'Model Name', 'HP Segment',
+    PRICE_TEXT_COLUMN, SALES_TEXT_COLUMN,
+    'Imported From (Country Name)', 'End Destination Country', 'Month', 'Year'
+]
+TEXT_COLUMN_SOURCES = {PRICE_TEXT_COLUMN: 'Price_Min', SALES_TEXT_COLUMN: 'Sales_Min'}
+
+def _parse_range_column(series):
+    """Parse a column of range text into (low, high) float arrays, once per distinct value"""
+    codes, uniques = pd.factorize(series)
+    parsed = np.array([parse_range(value) for value in uniques] + [(np.nan, np.nan)], dtype=float)
+    return parsed[codes, 0], parsed[codes, 1]
+
+def normalize_tractor_rows(raw):
+    """Convert rows in the source sheet layout into the typed dashboard schema.
+
+    HP, price and sales range text is parsed into the *_Min/*_Max columns and
+    the price and sales text columns are dropped. Month and Year are kept as
+    integers when present.
+    """
+    frame = raw[DIMENSION_COLUMNS].copy()
+    for column in DIMENSION_COLUMNS:
+        frame[column] = frame[column].str.strip()
+    if 'Month' in raw.columns and 'Year' in raw.columns:
+        frame['Month'] = raw['Month'].astype(np.int64)
+        frame['Year'] = raw['Year'].astype(np.int64)
+    
+    for prefix, column in [('HP', 'HP Segment'), ('Price', PRICE_TEXT_COLUMN), ('Sales', SALES_TEXT_COLUMN)]:
+        low, high = _parse_range_column(raw[column])
+        frame[f'{prefix}_Min'] = low
+        frame[f'{prefix}_Max'] = high
+    
+    return frame.reset_index(drop=True)
+
+# Bump when normalize_tractor_rows changes so stale snapshots are not reused
+SNAPSHOT_VERSION = 1
+DATA_CACHE_DIR = os.environ.get(
+    'TRACTOR_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+)
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def load_tractor_csv(path, cache_dir=DATA_CACHE_DIR):
+    """Load a tractor sheet such as last_sheet_clean.csv into the typed schema.
+
+    Handles the BOM, stray header whitespace, the 'Doller Value' header,
+    blank manufacturer cells that continue the row above, en-dash ranges and
+    the trailing blank and note rows. Monthly extracts add Month and Year
+    columns to the same layout.
+
+    The normalized frame is saved as a Feather snapshot named after the
+    file's SHA-256, so later loads of an unchanged file skip parsing.
+    Snapshots are skipped when pyarrow is not installed.
+    """
+    snapshot = None
+    if cache_dir:
+        snapshot = os.path.join(cache_dir, f"tractor_{_file_digest(path)[:24]}_v{SNAPSHOT_VERSION}.feather")
+        if os.path.exists(snapshot):
+            try:
+                return pd.read_feather(snapshot)
+            except ImportError:
+                snapshot = None
+    
+    raw = pd.read_csv(path, encoding='utf-8-sig', dtype=str)
+    raw.columns = [column.strip().replace('Doller', 'Dollar') for column in raw.columns]
+    
+    # Blank separator rows and the trailing note only fill the first column
+    raw = raw.dropna(subset=RAW_COLUMNS[1:], how='all')
+    raw['Manufacturer Name'] = raw['Manufacturer Name'].ffill()
+    frame = normalize_tractor_rows(raw)
+    
+    if snapshot:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            partial = f"{snapshot}.{os.getpid()}.tmp"
+            frame.to_feather(partial)
+            os.replace(partial, snapshot)
+        except ImportError:
+            logger.info("pyarrow is not installed; not caching %s", path)
+    
+    return frame
+
+# Store dimensions as categoricals and numbers in the smallest lossless dtype
+COMPACT_SCHEMA = os.environ.get('TRACTOR_COMPACT_SCHEMA', '1') != '0'
+
+def compact_schema(frame):
+    """Return `frame` with a compact dtype layout and log the memory saved.
+
+    The dimension columns become categoricals, Month and Year small integers,
+    sales counts int32 when they have no gaps, and the remaining float
+    columns float32 wherever that keeps every value exact.
+    """
+    before = frame.memory_usage(deep=True).sum()
+    compact = frame.copy()
+    for column in DIMENSION_COLUMNS:
+        compact[column] = compact[column].astype('category')
+    compact['Month'] = compact['Month'].astype(np.int8)
+    compact['Year'] = compact['Year'].astype(np.int16)
+    for column in ['HP_Min', 'HP_Max', 'Price_Min', 'Price_Max', 'Sales_Min', 'Sales_Max']:
+        values = compact[column].to_numpy()
+        if column.startswith('Sales') and not np.isnan(values).any() and (values == np.round(values)).all() \
+                and np.abs(values).max(initial=0) < np.iinfo(np.int32).max:
+            compact[column] = values.astype(np.int32)
+        elif np.array_equal(values.astype(np.float32).astype(values.dtype), values, equal_nan=True):
+            compact[column] = values.astype(np.float32)
+    
+    after = compact.memory_usage(deep=True).sum()
+    logger.info("Compact schema: %.2f MB -> %.2f MB (%.0f%% saved)",
+                before / 1e6, after / 1e6, 100 * (1 - after / before) if before else 0)
+    return compact
+
+def load_tractor_data(path=None, compact=COMPACT_SCHEMA):
+    """Build the dashboard dataset.
+
+    Without `path` the synthetic data is generated from the built-in
+    catalogue. A file with Month and Year columns is used as is; a file
+    without them is treated as a catalogue and expanded into monthly series.
+    With `compact` the result goes through compact_schema.
+    """
+    if not path:
+        frame = create_comprehensive_dummy_data()
+    else:
+        frame = load_tractor_csv(path)
+        if 'Month' not in frame.columns:
+            frame = create_comprehensive_dummy_data(catalogue=frame)
+        else:
+            add_derived_columns(frame)
+    
+    return compact_schema(frame) if compact else frame
+
+def with_display_columns(frame):
+    """Return `frame` with the price and sales range text columns after 'HP Segment'"""
+    frame = frame.copy(deep=False)
+    position = frame.columns.get_loc('HP Segment') + 1
+    frame.insert(position, PRICE_TEXT_COLUMN,
+                 [f"${low:,.0f} - ${high:,.0f}" for low, high in zip(frame['Price_Min'], frame['Price_Max'])])
+    frame.insert(position + 1, SALES_TEXT_COLUMN,
+                 [f"{low:.0f}-{high:.0f}" for low, high in zip(frame['Sales_Min'], frame['Sales_Max'])])
+    return frame
+
+def create_comprehensive_dummy_data(rng=None, start='2024-01', end='2025-12', n_base_rows=None,
+                                    catalogue=None):
+    """Create comprehensive dummy data based on the provided tractor data structure.
+
+    The month x series grid is generated in one pass with NumPy broadcasting.
+    `rng` is a np.random.Generator (pass a seeded one for reproducible data),
+    `start` and `end` bound the monthly span inclusively, and `n_base_rows`
+    sets the number of product series per month; beyond the catalogue the
+    series are repeated with a numbered suffix on the model name.
+    `catalogue` is a typed frame from normalize_tractor_rows (for example
+    the output of load_tractor_csv); the built-in catalogue below is used
+    when it is omitted.
+    """
     
     # Base data from the provided CSV
     base_data = [
@@ -68,112 +456,78 @@ def create_comprehensive_dummy_data():
         ["CNH Industrial (New Holland)", "Puma Series", "Puma 150, Puma 175, Puma 200", "150 - 240 HP", "$60,600 - $279,000", "50-90", "Austria", "USA/EU"]
     ]
     
-    # Create comprehensive dataset with monthly data for 2 years
-    comprehensive_data = []
+    if rng is None:
+        rng = np.random.default_rng()
+    if catalogue is None:
+        catalogue = normalize_tractor_rows(pd.DataFrame(base_data, columns=RAW_COLUMNS))
     
-    # Generate data for each month from 2024 to 2025
-    start_date = datetime(2024, 1, 1)
-    end_date = datetime(2025, 12, 31)
+    # Catalogue ranges are parsed once; everything below stays numeric
+    base = catalogue[DIMENSION_COLUMNS].to_numpy(dtype=object)
+    base_hp = catalogue[['HP_Min', 'HP_Max']].to_numpy(dtype=float)
+    base_prices = catalogue[['Price_Min', 'Price_Max']].to_numpy(dtype=float)
+    base_sales = catalogue[['Sales_Min', 'Sales_Max']].to_numpy(dtype=float)
+    n_catalogue = len(catalogue)
     
-    current_date = start_date
-    while current_date <= end_date:
-        month = current_date.month
-        year = current_date.year
-        
-        for row in base_data:
-            # Add some variation to sales data based on seasonality
-            base_sales_min, base_sales_max = row[5].split('-')
-            base_sales_min = int(base_sales_min.replace(',', '').strip())
-            base_sales_max = int(base_sales_max.replace(',', '').strip())
-            
-            # Seasonal variation (higher sales in spring and fall)
-            if month in [3, 4, 5, 9, 10, 11]:  # Spring and Fall
-                seasonal_factor = np.random.uniform(1.1, 1.3)
-            elif month in [6, 7, 8]:  # Summer
-                seasonal_factor = np.random.uniform(0.8, 1.0)
-            else:  # Winter
-                seasonal_factor = np.random.uniform(0.7, 0.9)
-            
-            # Add some random variation
-            random_factor = np.random.uniform(0.9, 1.1)
-            
-            # Add growth factor for 2025 (extrapolation)
-            if year == 2025:
-                # Assume 5-15% growth for 2025 based on market trends
-                growth_factor = np.random.uniform(1.05, 1.15)
-            else:
-                growth_factor = 1.0
-            
-            total_factor = seasonal_factor * random_factor * growth_factor
-            
-            adjusted_sales_min = int(base_sales_min * total_factor)
-            adjusted_sales_max = int(base_sales_max * total_factor)
-            
-            # Add price variation between years
-            base_price = row[4]  # Original price range
-            if year == 2025:
-                # Extract price range and apply inflation/growth
-                price_min_str = base_price.split('-')[0].replace('$', '').replace(',', '').strip()
-                price_max_str = base_price.split('-')[1].replace('$', '').replace(',', '').replace('+', '').strip()
-                
-                price_min = float(price_min_str)
-                price_max = float(price_max_str)
-                
-                # Apply 3-8% price increase for 2025
-                price_inflation = np.random.uniform(1.03, 1.08)
-                adjusted_price_min = int(price_min * price_inflation)
-                adjusted_price_max = int(price_max * price_inflation)
-                
-                adjusted_price = f"${adjusted_price_min:,} - ${adjusted_price_max:,}"
-            else:
-                adjusted_price = base_price
-            
-            comprehensive_data.append([
-                row[0],  # Manufacturer Name
-                row[1],  # Brand Name
-                row[2],  # Model Name
-                row[3],  # HP Segment
-                adjusted_price,  # Dollar Value (adjusted for year)
-                f"{adjusted_sales_min}-{adjusted_sales_max}",  # Monthly Sales
-                row[6],  # Imported From
-                row[7],  # End Destination Country
-                month,   # Month
-                year     # Year
-            ])
-        
-        # Move to next month
-        if current_date.month == 12:
-            current_date = current_date.replace(year=current_date.year + 1, month=1)
-        else:
-            current_date = current_date.replace(month=current_date.month + 1)
+    # Grid axes: months (rows) x product series (columns)
+    periods = pd.period_range(start, end, freq='M')
+    month_axis = periods.month.to_numpy()
+    year_axis = periods.year.to_numpy()
+    n_series = n_catalogue if n_base_rows is None else n_base_rows
+    series = np.arange(n_series) % n_catalogue
+    shape = (len(periods), n_series)
     
-    # Create DataFrame
-    df = pd.DataFrame(comprehensive_data, columns=[
-        'Manufacturer Name', 'Brand Name', 'Model Name', 'HP Segment',
-        'Dollar Value of Tractor (ASP Range in US$)', 'Monthly Sale Data (Units)',
-        'Imported From (Country Name)', 'End Destination Country', 'Month', 'Year'
-    ])
+    # Seasonal variation (higher sales in spring and fall, lower in winter)
+    seasonal_low = np.select(
+        [np.isin(month_axis, [3, 4, 5, 9, 10, 11]), np.isin(month_axis, [6, 7, 8])],
+        [1.1, 0.8],
+        default=0.7
+    )
+    seasonal_factor = seasonal_low[:, None] + rng.uniform(0.0, 0.2, shape)
+    
+    # Add some random variation
+    random_factor = rng.uniform(0.9, 1.1, shape)
     
-    # Process numeric fields for better analysis
-    # Extract HP values
-    df['HP_Min'] = df['HP Segment'].str.extract(r'(\d+(?:\.\d+)?)').astype(float)
-    df['HP_Max'] = df['HP Segment'].str.extract(r'(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)')[1].astype(float)
-    df['HP_Max'] = df['HP_Max'].fillna(df['HP_Min'])
-    
-    # Extract price values
-    df['Price_Min'] = df['Dollar Value of Tractor (ASP Range in US$)'].str.extract(r'\$([\d,]+)')
-    df['Price_Min'] = df['Price_Min'].str.replace(',', '').astype(float)
-    df['Price_Max'] = df['Dollar Value of Tractor (ASP Range in US$)'].str.extract(r'\$([\d,]+)\s*-\s*\$([\d,]+)')[1]
-    df['Price_Max'] = df['Price_Max'].str.replace(',', '').astype(float)
-    df['Price_Max'] = df['Price_Max'].fillna(df['Price_Min'])
-    
-    # Extract sales values
-    df['Sales_Min'] = df['Monthly Sale Data (Units)'].str.extract(r'(\d+(?:,\d+)?)')
-    df['Sales_Min'] = df['Sales_Min'].str.replace(',', '').astype(float)
-    df['Sales_Max'] = df['Monthly Sale Data (Units)'].str.extract(r'(\d+(?:,\d+)?)\s*[–\-]\s*(\d+(?:,\d+)?)')[1]
-    df['Sales_Max'] = df['Sales_Max'].str.replace(',', '').astype(float)
-    df['Sales_Max'] = df['Sales_Max'].fillna(df['Sales_Min'])
+    # 5-15% growth per year after the first year of the span (extrapolation)
+    years_elapsed = (year_axis - year_axis[0])[:, None]
+    growth_factor = rng.uniform(1.05, 1.15, shape) ** years_elapsed
     
+    total_factor = seasonal_factor * random_factor * growth_factor
+    sales_min = (base_sales[series, 0] * total_factor).astype(np.int64).ravel()
+    sales_max = (base_sales[series, 1] * total_factor).astype(np.int64).ravel()
+    
+    # 3-8% price increase per year after the first year of the span
+    price_inflation = rng.uniform(1.03, 1.08, shape) ** years_elapsed
+    price_min = (base_prices[series, 0] * price_inflation).astype(np.int64).ravel()
+    price_max = (base_prices[series, 1] * price_inflation).astype(np.int64).ravel()
+    
+    # Repeated series get a numbered model name so every series stays distinct
+    model_names = base[series, 2].copy()
+    repeat = np.arange(n_series) // n_catalogue
+    model_names[repeat > 0] = [f"{name} #{k}" for name, k in
+                               zip(model_names[repeat > 0], repeat[repeat > 0])]
+    
+    # Create DataFrame
+    df = pd.DataFrame({
+        'Manufacturer Name': np.tile(base[series, 0], len(periods)),
+        'Brand Name': np.tile(base[series, 1], len(periods)),
+        'Model Name': np.tile(model_names, len(periods)),
+        'HP Segment': np.tile(base[series, 3], len(periods)),
+        'Imported From (Country Name)': np.tile(base[series, 4], len(periods)),
+        'End Destination Country': np.tile(base[series, 5], len(periods)),
+        'Month': np.repeat(month_axis, n_series).astype(np.int64),
+        'Year': np.repeat(year_axis, n_series).astype(np.int64),
+        'HP_Min': np.tile(base_hp[series, 0], len(periods)),
+        'HP_Max': np.tile(base_hp[series, 1], len(periods)),
+        'Price_Min': price_min.astype(float),
+        'Price_Max': price_max.astype(float),
+        'Sales_Min': sales_min.astype(float),
+        'Sales_Max': sales_max.astype(float)
+    })
+    
+    return add_derived_columns(df)
+
+def add_derived_columns(df):
+    """Add the Date field and the HP, price and sales categories in place"""
     # Create date field for time series analysis
     df['Date'] = pd.to_datetime(df[['Year', 'Month']].assign(day=1))
     
@@ -195,289 +549,828 @@ def create_comprehensive_dummy_data():
     
     return df
 
-# Load comprehensive data
-df = create_comprehensive_dummy_data()
-
-# Get unique values for filters
-manufacturers = sorted(df['Manufacturer Name'].unique())
-brands = sorted(df['Brand Name'].unique())
-models = sorted(df['Model Name'].unique())
-hp_segments = sorted(df['HP Segment'].unique())
-import_countries = sorted(df['Imported From (Country Name)'].unique())
-destination_countries = sorted(df['End Destination Country'].unique())
-months = sorted(df['Month'].unique())
-years = sorted(df['Year'].unique())
-
-# Define the layout
-app.layout = dbc.Container([
-    # Header
-    dbc.Row([
-        dbc.Col([
-            html.Div([
-                html.H1([
-                    html.I(className="fas fa-tractor me-3 text-primary"),
-                    "Dashboard – Japan Agricultural Tractor Tracker"
-                ], className="text-center text-primary mb-3 fw-bold"),
-                html.P([
-                    html.I(className="fas fa-chart-line me-2 text-info"),
-                    "Complete Market Intelligence with Advanced Filtering & Export"
-                ], className="text-center text-muted mb-4 fs-5"),
-                html.Hr(className="border-primary border-2")
-            ])
-        ], width=12)
-    ], className="mb-4"),
-    
-    # Disclaimer at top
-    dbc.Row([
-        dbc.Col([
-            dbc.Alert([
-                html.I(className="fas fa-exclamation-triangle me-2"),
-                html.Strong("Note: This dataset is for illustration purposes only. It does not represent actual data and has no association with real-world datasets.")
-            ], color="danger", className="text-center fst-italic")
-        ], width=12)
-    ], className="mb-4"),
-    
-    # Filters Section
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-                    html.H4([
-                        html.I(className="fas fa-filter me-2"),
-                        "Advanced Filters"
-                    ], className="mb-0")
-                ]),
-                dbc.CardBody([
-                    # First row of filters
-                    dbc.Row([
-                        dbc.Col([
-                            html.Label("Manufacturer:", className="fw-bold"),
-                            dcc.Dropdown(
-                                id='manufacturer-filter',
-                                options=[{'label': 'All Manufacturers', 'value': 'All'}] + 
-                                        [{'label': m, 'value': m} for m in manufacturers],
-                                value='All',
-                                clearable=False,
-                                className="mb-3"
-                            )
-                        ], width=3),
-                        dbc.Col([
-                            html.Label("Brand/Series Name:", className="fw-bold"),
-                            dcc.Dropdown(
-                                id='brand-filter',
-                                options=[{'label': 'All Brands', 'value': 'All'}],
-                                value='All',
-                                clearable=False,
-                                className="mb-3"
-                            )
-                        ], width=3),
-                        dbc.Col([
-                            html.Label("Model:", className="fw-bold"),
-                            dcc.Dropdown(
-                                id='model-filter',
-                                options=[{'label': 'All Models', 'value': 'All'}],
-                                value='All',
-                                clearable=False,
-                                className="mb-3"
-                            )
-                        ], width=3),
-                        dbc.Col([
-                            html.Label("HP Segment:", className="fw-bold"),
-                            dcc.Dropdown(
-                                id='hp-segment-filter',
-                                options=[{'label': 'All HP Segments', 'value': 'All'}] + 
-                                        [{'label': h, 'value': h} for h in hp_segments],
-                                value='All',
-                                clearable=False,
-                                className="mb-3"
-                            )
-                        ], width=3)
+# The eight dashboard filter dimensions, in apply_filters argument order
+FILTER_COLUMNS = [
+    'Manufacturer Name', 'Brand Name', 'Model Name', 'HP Segment',
+    'Imported From (Country Name)', 'End Destination Country', 'Year', 'Month'
+]
+
+# Month names for month numbers; MONTH_NAME_LOOKUP is indexed directly by month number
+MONTH_NAMES = [datetime(2024, m, 1).strftime('%B') for m in range(1, 13)]
+MONTH_NAME_LOOKUP = np.array([''] + MONTH_NAMES, dtype=object)
+
+class FilterIndex:
+    """Per-value row position lists for the filter dimensions of a dataframe.
+
+    Every column in FILTER_COLUMNS is factorized once into integer codes, and
+    the row positions of each distinct value are stored as one sorted slice of
+    a single position array. A filter combination is answered by starting from
+    the shortest matching position list and checking the remaining dimensions
+    through their codes, so the cost follows the size of the result rather
+    than the size of the table.
+    """
+
+    def __init__(self, frame):
+        self.df = frame
+        self.n_rows = len(frame)
+        self._codes = {}
+        self._lookup = {}
+        self._order = {}
+        self._bounds = {}
+        for column in FILTER_COLUMNS:
+            codes, uniques = pd.factorize(frame[column], sort=True)
+            codes = codes.astype(np.int32)
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            # Read-only: callers get views of these arrays and must not modify them
+            for array in (codes, order, bounds):
+                array.setflags(write=False)
+            self._codes[column] = codes
+            self._lookup[column] = {value: code for code, value in enumerate(uniques)}
+            self._order[column] = order
+            self._bounds[column] = bounds
+
+    def values(self, column):
+        """Sorted distinct values of `column`"""
+        return sorted(self._lookup[column])
+
+    def positions(self, column, value):
+        """Return the sorted row positions where `column` equals `value`"""
+        code = self._lookup[column].get(value)
+        if code is None:
+            return np.empty(0, dtype=np.intp)
+        bounds = self._bounds[column]
+        return self._order[column][bounds[code]:bounds[code + 1]]
+
+    def select(self, *values):
+        """Return sorted row positions matching one value per filter column.
+
+        `values` follow FILTER_COLUMNS order; 'All' leaves a dimension
+        unfiltered. Returns None when no dimension is filtered.
+        """
+        active = [(column, value) for column, value in zip(FILTER_COLUMNS, values)
+                  if value != 'All']
+        if not active:
+            return None
+
+        candidates = [(self.positions(column, value), column, value) for column, value in active]
+        candidates.sort(key=lambda item: len(item[0]))
+        result, _, _ = candidates[0]
+        for _, column, value in candidates[1:]:
+            if len(result) == 0:
+                break
+            result = result[self._codes[column][result] == self._lookup[column][value]]
+        return result
+
+    def extend(self, frame):
+        """Index for `frame`, whose first `n_rows` rows are the rows indexed here.
+
+        Only the appended rows are factorized. Values seen before keep their
+        codes and new values get the next ones; each value's position slice
+        is the old slice followed by the new rows, so nothing already indexed
+        is re-sorted.
+        """
+        index = FilterIndex.__new__(FilterIndex)
+        index.df = frame
+        index.n_rows = len(frame)
+        index._codes, index._lookup, index._order, index._bounds = {}, {}, {}, {}
+        n_old = self.n_rows
+        for column in FILTER_COLUMNS:
+            lookup = dict(self._lookup[column])
+            local_codes, uniques = pd.factorize(frame[column].iloc[n_old:], sort=True)
+            mapping = np.array([lookup.setdefault(value, len(lookup)) for value in uniques] + [-1],
+                               dtype=np.int32)
+            new_codes = mapping[local_codes]  # code -1 (missing) picks the trailing -1
+            
+            # Slot 0 holds rows with a missing value, slot k + 1 the rows of code k
+            old_start = np.concatenate(([0], self._bounds[column]))
+            slot_counts = np.zeros(len(lookup) + 1, dtype=np.intp)
+            slot_counts[:len(old_start) - 1] = np.diff(old_start)
+            new_slots = new_codes + 1
+            new_counts = np.bincount(new_slots, minlength=len(lookup) + 1)
+            start = np.concatenate(([0], np.cumsum(slot_counts + new_counts)))
+            
+            order = np.empty(len(frame), dtype=np.intp)
+            old_slots = np.repeat(np.arange(len(old_start) - 1), np.diff(old_start))
+            order[np.arange(n_old) - old_start[old_slots] + start[old_slots]] = self._order[column]
+            new_order = np.argsort(new_slots, kind='stable')
+            sorted_slots = new_slots[new_order]
+            first_new = np.concatenate(([0], np.cumsum(new_counts)))[sorted_slots]
+            rank = np.arange(len(new_order)) - first_new
+            order[start[sorted_slots] + slot_counts[sorted_slots] + rank] = new_order + n_old
+            
+            codes = np.concatenate((self._codes[column], new_codes)).astype(np.int32)
+            bounds = start[1:]
+            for array in (codes, order, bounds):
+                array.setflags(write=False)
+            index._codes[column] = codes
+            index._lookup[column] = lookup
+            index._order[column] = order
+            index._bounds[column] = bounds
+        return index
+
+# Additive measures kept in the aggregate cubes
+CUBE_MEASURES = ['Price_Min', 'Price_Max', 'Sales_Min', 'Sales_Max']
+CUBE_CELL_COLUMNS = ['Rows'] + [f'{m}_{part}' for m in CUBE_MEASURES for part in ('sum', 'count')]
+
+# Columns a cube can be keyed by: the filter dimensions and the HP category the charts group by
+CUBE_KEYS = FILTER_COLUMNS + ['HP_Category']
+
+# Dimensions each consumer groups cube cells by, on top of the filtered ones
+CARD_DIMENSIONS = ('Manufacturer Name', 'Model Name')
+CHART_DIMENSIONS = ('Manufacturer Name', 'Month', 'HP_Category')
+HIERARCHY_DIMENSIONS = ('Manufacturer Name', 'Brand Name', 'Model Name')
+
+# Memory budget for the roll-up cubes of one dataset; the least recently used ones are dropped beyond it
+CUBE_CACHE_BYTES = int(float(os.environ.get('CUBE_CACHE_MB', 64)) * 1024 * 1024)
+
+# A grain expected to have more than one cell per this many rows is not worth a cube:
+# filter states needing it are aggregated from their selected rows instead
+CUBE_MIN_REDUCTION = int(os.environ.get('CUBE_MIN_REDUCTION', 8))
+
+def build_cube(frame, keys=CUBE_KEYS):
+    """Aggregate `frame` to one cell per distinct combination of `keys`.
+
+    Each cell holds its row count ('Rows') and, per measure, the sum and the
+    number of non-null values ('<measure>_sum', '<measure>_count'), so row
+    counts, sums, means and distinct key values for any filter on the keys
+    can be answered from the cells alone.
+    """
+    keys = list(keys)
+    measures = frame[CUBE_MEASURES].astype(np.float64)
+    grouped = pd.concat([frame[keys], measures], axis=1).groupby(
+        keys, observed=True, sort=False, dropna=False)
+    cube = grouped.size().rename('Rows').to_frame()
+    for measure in CUBE_MEASURES:
+        cube[f'{measure}_sum'] = grouped[measure].sum()
+        cube[f'{measure}_count'] = grouped[measure].count()
+    return cube.reset_index()
+
+def rollup_cube(cube, keys):
+    """Roll the cells of `cube` up to `keys`, a subset of its key columns"""
+    return (cube.groupby(list(keys), observed=True, sort=False, dropna=False)[CUBE_CELL_COLUMNS]
+            .sum().reset_index())
+
+def cube_mean(cells, measure):
+    """Mean of `measure` over the raw rows behind the selected cube cells"""
+    return cells[f'{measure}_sum'].sum() / cells[f'{measure}_count'].sum()
+
+def align_frames(frame, other):
+    """Return `frame` and `other` with identical dtypes, so they concatenate without conversion.
+
+    Categoricals get the union of both category lists (the existing
+    categories first, so current codes are unchanged). Other columns of
+    `other` are cast to `frame`'s dtype when every value survives the cast;
+    otherwise both are cast to a dtype that holds them both.
+    """
+    frame, other = frame.copy(deep=False), other[frame.columns].copy()
+    for column in frame.columns:
+        left, right = frame[column], other[column]
+        if isinstance(left.dtype, pd.CategoricalDtype):
+            right = right.astype(object)
+            extra = pd.Index(right.dropna().unique()).difference(left.cat.categories)
+            dtype = pd.CategoricalDtype(left.cat.categories.append(extra), ordered=left.cat.ordered)
+            # The old categories are a prefix of the new ones, so the codes carry over as they are
+            frame[column] = pd.Categorical.from_codes(left.cat.codes, dtype=dtype)
+            other[column] = right.astype(dtype)
+        elif left.dtype != right.dtype:
+            cast = right.astype(left.dtype) if right.notna().all() or left.dtype.kind == 'f' else None
+            if cast is not None and np.array_equal(cast.to_numpy(dtype=np.float64, na_value=np.nan),
+                                                   right.to_numpy(dtype=np.float64, na_value=np.nan),
+                                                   equal_nan=True):
+                other[column] = cast
+            else:
+                dtype = np.result_type(left.dtype, right.dtype)
+                frame[column], other[column] = left.astype(dtype), right.astype(dtype)
+    return frame, other
+
+def merge_cubes(cube, other):
+    """Add the cells of `other` into `cube`.
+
+    Cells whose key is already in `cube` have their row counts, sums and
+    counts added in place and the rest are appended, so every existing cell
+    keeps its position. When the cube is keyed by Year or Month, only the
+    cells of the periods in `other` are compared.
+    """
+    keys = [column for column in CUBE_KEYS if column in cube.columns]
+    periods = [column for column in ('Year', 'Month') if column in keys]
+    cube, other = align_frames(cube, other)
+    candidates = np.arange(len(cube))
+    if periods:
+        def period(frame):
+            return sum(frame[column].to_numpy(np.int64) * 100 ** i for i, column in enumerate(reversed(periods)))
+        candidates = np.flatnonzero(np.isin(period(cube), np.unique(period(other))))
+    matched = (cube[keys].iloc[candidates].assign(_cell=candidates)
+               .merge(other[keys].assign(_other=np.arange(len(other))), on=keys, how='inner'))
+    cells, others = matched['_cell'].to_numpy(), matched['_other'].to_numpy()
+    
+    merged = cube.copy(deep=False)
+    for column in cube.columns.difference(keys, sort=False):
+        values = cube[column].to_numpy().copy()
+        values[cells] += other[column].to_numpy()[others]
+        merged[column] = values
+    appended = np.ones(len(other), dtype=bool)
+    appended[others] = False
+    return pd.concat([merged, other[appended]], ignore_index=True)
+
+class CubeRollups:
+    """Aggregate cubes of one dataset, one per grain (a subset of CUBE_KEYS), built on first use.
+
+    A filter state is answered from the cube keyed by the filtered columns
+    plus the dimensions the caller groups by, so the cells scanned follow the
+    number of distinct values of those columns rather than the number of
+    rows; with no filter, the summary cards read one cell per model and the
+    charts one per manufacturer, month and HP category. A new grain is
+    rolled up from the smallest built cube that contains it, or aggregated
+    from the rows when there is none.
+
+    Cubes are kept in an LRU bounded by CUBE_CACHE_BYTES. A grain expected
+    to come close to one cell per row (say models by month) is never built:
+    its filter states are grouped from the rows `index` selects for them.
+    """
+
+    def __init__(self, frame, index, cubes=(), max_bytes=CUBE_CACHE_BYTES):
+        self.df = frame
+        self.index = index
+        self.max_bytes = max_bytes
+        self._cubes = OrderedDict()
+        self._sizes = {}
+        self._bytes = 0
+        self._distinct = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+        for grain, cube in cubes:
+            self._store(grain, cube)
+
+    def _store(self, grain, cube):
+        """Keep a cube unless it alone exceeds the budget, evicting least recently used ones (lock held)"""
+        size = int(cube.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return
+        self._cubes[grain] = cube
+        self._sizes[grain] = size
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            evicted, _ = self._cubes.popitem(last=False)
+            self._bytes -= self._sizes.pop(evicted)
+            self.evictions += 1
+
+    def distinct(self, column):
+        """Number of distinct values of a key column"""
+        count = self._distinct.get(column)
+        if count is None:
+            if column in FILTER_COLUMNS:
+                count = len(self.index.values(column))
+            else:
+                count = self.df[column].nunique(dropna=False)
+            self._distinct[column] = count
+        return count
+
+    def estimated_cells(self, grain):
+        """Upper bound on the cells of a grain: a built cube it extends, times the distinct values of the rest"""
+        with self._lock:
+            built = [(set(key), len(cube)) for key, cube in self._cubes.items() if set(key) <= set(grain)]
+        bound = len(self.df)
+        for key, cells in built + [(set(), 1)]:
+            for column in set(grain) - key:
+                cells *= self.distinct(column)
+            bound = min(bound, cells)
+        return bound
+
+    def cube(self, dimensions):
+        """The cube keyed by `dimensions` (any order)"""
+        grain = tuple(column for column in CUBE_KEYS if column in dimensions)
+        with self._lock:
+            cube = self._cubes.get(grain)
+            if cube is not None:
+                self._cubes.move_to_end(grain)
+                return cube
+            sources = [built for key, built in self._cubes.items() if set(grain) <= set(key)]
+        # Built outside the lock; two threads may both build a new grain, and the first one is kept
+        if sources:
+            cube = rollup_cube(min(sources, key=len), grain)
+        else:
+            cube = build_cube(self.df, grain)
+        with self._lock:
+            if grain in self._cubes:
+                cube = self._cubes[grain]
+                self._cubes.move_to_end(grain)
+            else:
+                self._store(grain, cube)
+        return cube
+
+    def cells(self, filters, dimensions):
+        """Cells matching a filter state (one value per FILTER_COLUMNS entry, 'All' for none).
+
+        The cells are keyed by the filtered columns and `dimensions`.
+        """
+        active = [(column, value) for column, value in zip(FILTER_COLUMNS, filters) if value != 'All']
+        keys = [column for column, _ in active] + list(dimensions)
+        grain = tuple(column for column in CUBE_KEYS if column in keys)
+        with self._lock:
+            built = grain in self._cubes
+        if active and not built and self.estimated_cells(grain) * CUBE_MIN_REDUCTION > len(self.df):
+            positions = select_index_rows(self.index, tuple(filters))
+            return build_cube(self.df.iloc[positions], grain)
+        cube = self.cube(grain)
+        if not active:
+            return cube
+        mask = np.ones(len(cube), dtype=bool)
+        for column, value in active:
+            mask &= (cube[column] == value).to_numpy()
+        return cube[mask]
+
+    def extend(self, frame, index, added):
+        """Roll-ups for `frame`, which is this dataset followed by the rows `added`, with its `index`.
+
+        Every cube built so far has the cube of the added rows merged into it
+        rather than being rebuilt.
+        """
+        with self._lock:
+            cubes = list(self._cubes.items())
+        return CubeRollups(frame, index, [(grain, merge_cubes(cube, build_cube(added, grain)))
+                                          for grain, cube in cubes], self.max_bytes)
+
+    def stats(self):
+        """Cube count and size, for monitoring"""
+        with self._lock:
+            return {'entries': len(self._cubes), 'bytes': self._bytes,
+                    'max_bytes': self.max_bytes, 'evictions': self.evictions}
+
+def build_card_cells(cube):
+    """Columnar, dictionary-encoded copy of the cube for the clientside summary cards.
+
+    Cells are rolled up to the eight filter columns. Each filter column is
+    sent as its distinct values (as strings, to compare with dropdown values)
+    plus one integer code per cell, and each measure as a plain list, so the
+    browser can filter and total the cells without a server round trip.
+    """
+    measures = CUBE_CELL_COLUMNS
+    cells = cube.groupby(FILTER_COLUMNS, observed=True, sort=False, dropna=False)[measures].sum().reset_index()
+    values, codes = {}, {}
+    for column in FILTER_COLUMNS:
+        column_codes, uniques = pd.factorize(cells[column].astype(str))
+        values[column] = uniques.tolist()
+        codes[column] = column_codes.tolist()
+    return {
+        'columns': FILTER_COLUMNS,
+        'values': values,
+        'codes': codes,
+        'measures': {measure: cells[measure].astype(np.float64).tolist() for measure in measures},
+    }
+
+# Largest number of markers the Price vs HP scatter draws one per row
+SCATTER_MAX_POINTS = int(os.environ.get('SCATTER_MAX_POINTS', 5000))
+SCATTER_KEYS = ['Manufacturer Name', 'Brand Name', 'Model Name', 'Year', 'Month']
+SCATTER_EXTREME_COLUMNS = ['HP_Min', 'Price_Min', 'Sales_Min']
+
+def downsample_extremes(frame, max_points, columns=SCATTER_EXTREME_COLUMNS):
+    """Reduce `frame` to about `max_points` rows, always keeping the extremes.
+
+    The rows holding the minimum and maximum of each of `columns` are kept so
+    outliers stay visible and the axis ranges do not change; the rest of the
+    budget is filled with rows evenly spaced along the first column.
+    """
+    if len(frame) <= max_points:
+        return frame
+    extremes = set()
+    for column in columns:
+        values = frame[column].to_numpy(dtype=np.float64)
+        if np.isnan(values).all():
+            continue
+        extremes.update((int(np.nanargmin(values)), int(np.nanargmax(values))))
+    extremes = np.fromiter(extremes, dtype=np.int64)
+    order = np.argsort(frame[columns[0]].to_numpy(dtype=np.float64), kind='stable')
+    remaining = order[~np.isin(order, extremes)]
+    budget = min(max(max_points - len(extremes), 0), len(remaining))
+    sampled = remaining[np.linspace(0, len(remaining) - 1, budget).astype(np.int64)]
+    return frame.iloc[np.union1d(extremes, sampled)]
+
+def scatter_points(frame, max_points=SCATTER_MAX_POINTS):
+    """Points for the Price vs HP scatter, and whether they are aggregated.
+
+    Small selections are plotted one marker per row. Above `max_points` rows
+    the selection is collapsed to one point per model and month (mean HP and
+    price, summed sales, maximum price and sales), and downsampled with the
+    extremes preserved if that is still too many.
+    """
+    if len(frame) <= max_points:
+        return frame, False
+    grouped = frame.groupby(SCATTER_KEYS, observed=True, sort=False)
+    points = grouped.agg(
+        HP_Min=('HP_Min', 'mean'),
+        Price_Min=('Price_Min', 'mean'),
+        Sales_Min=('Sales_Min', 'sum'),
+        Price_Max=('Price_Max', 'max'),
+        Sales_Max=('Sales_Max', 'max'),
+    )
+    points['Rows'] = grouped.size()
+    points = points.reset_index()
+    return downsample_extremes(points, max_points), True
+
+def build_option_hierarchy(frame):
+    """Distinct brands and models under each manufacturer and brand, for the cascading dropdowns.
+
+    Maps each manufacturer (and 'All') to {'brands': [...], 'models': {brand or
+    'All': [...]}} with every list sorted, so the dropdown options are plain
+    dictionary lookups on the server and in the browser alike.
+    """
+    triples = frame[['Manufacturer Name', 'Brand Name', 'Model Name']].dropna().drop_duplicates().astype(str)
+    hierarchy = {}
+    for manufacturer, rows in [('All', triples)] + list(triples.groupby('Manufacturer Name')):
+        models = {'All': sorted(rows['Model Name'].unique())}
+        for brand, brand_rows in rows.groupby('Brand Name'):
+            models[brand] = sorted(brand_rows['Model Name'].unique())
+        hierarchy[manufacturer] = {'brands': sorted(rows['Brand Name'].unique()), 'models': models}
+    return hierarchy
+
+# Summary cards are computed on the server ('server') or in the browser ('clientside')
+SUMMARY_CARDS_CALLBACK = os.environ.get('SUMMARY_CARDS_CALLBACK', 'server')
+
+# Cascading dropdowns run in the browser ('clientside') or as server callbacks ('server')
+DROPDOWN_CALLBACKS = os.environ.get('DROPDOWN_CALLBACKS', 'clientside')
+
+# The dataset and everything derived from it are built on first use (or by
+# warm_up()), not at import, so importing the module stays cheap. These
+# globals are assigned by set_dataset(); until then, reading one of them as a
+# module attribute loads the data through __getattr__ below.
+DATASET_GLOBALS = ('df', 'filter_index', 'rollups',
+                   'option_hierarchy', 'card_cells', 'filter_options')
+
+# Bumped whenever the dataset is replaced; part of every figure cache key (0 = not loaded)
+dataset_version = 0
+_data_lock = threading.RLock()
+
+def get_data():
+    """The loaded dataset, loading it on first use (TRACTOR_DATA_PATH points at a real extract)"""
+    if dataset_version == 0:
+        with _data_lock:
+            if dataset_version == 0:
+                set_dataset(load_tractor_data(os.environ.get('TRACTOR_DATA_PATH')))
+                sync_ingested()
+    return df
+
+def __getattr__(name):
+    if name in DATASET_GLOBALS:
+        get_data()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Export menu entries: (component id suffix, export route extension, label)
+DOWNLOAD_FORMAT_LINKS = [
+    ('csv-gz', 'csv.gz', "CSV (gzip)"),
+    ('csv-zst', 'csv.zst', "CSV (zstd)"),
+    ('parquet', 'parquet', "Parquet"),
+    ('arrow', 'arrow', "Arrow IPC (Feather)"),
+]
+
+# Define the layout; Dash calls this on every page load
+def serve_layout():
+    """Page layout, with filter options from the loaded dataset.
+
+    Dash also calls this to collect component ids: once when it is assigned
+    (outside any request) and again on the first request, whatever its route.
+    Those calls get the layout with empty options, so that importing the
+    module or answering a health check does not load the data.
+    """
+    if has_request_context() and request.endpoint != 'health_check':
+        get_data()
+        options, hierarchy, card_urls = filter_options, option_hierarchy, summary_card_urls()
+    else:
+        options, hierarchy, card_urls = {column: [] for column in FILTER_COLUMNS}, None, None
+    
+    # Get unique values for filters
+    manufacturers = options['Manufacturer Name']
+    hp_segments = options['HP Segment']
+    import_countries = options['Imported From (Country Name)']
+    destination_countries = options['End Destination Country']
+    months = options['Month']
+    years = options['Year']
+    
+    return dbc.Container([
+        # Header
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    html.H1([
+                        html.I(className="fas fa-tractor me-3 text-primary"),
+                        "Dashboard – Japan Agricultural Tractor Tracker"
+                    ], className="text-center text-primary mb-3 fw-bold"),
+                    html.P([
+                        html.I(className="fas fa-chart-line me-2 text-info"),
+                        "Complete Market Intelligence with Advanced Filtering & Export"
+                    ], className="text-center text-muted mb-4 fs-5"),
+                    html.Hr(className="border-primary border-2")
+                ])
+            ], width=12)
+        ], className="mb-4"),
+    
+        # Disclaimer at top
+        dbc.Row([
+            dbc.Col([
+                dbc.Alert([
+                    html.I(className="fas fa-exclamation-triangle me-2"),
+                    html.Strong("Note: This dataset is for illustration purposes only. It does not represent actual data and has no association with real-world datasets.")
+                ], color="danger", className="text-center fst-italic")
+            ], width=12)
+        ], className="mb-4"),
+    
+        # Filters Section
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H4([
+                            html.I(className="fas fa-filter me-2"),
+                            "Advanced Filters"
+                        ], className="mb-0")
                     ]),
+                    dbc.CardBody([
+                        # First row of filters
+                        dbc.Row([
+                            dbc.Col([
+                                html.Label("Manufacturer:", className="fw-bold"),
+                                dcc.Dropdown(
+                                    id='manufacturer-filter',
+                                    options=[{'label': 'All Manufacturers', 'value': 'All'}] + 
+                                            [{'label': m, 'value': m} for m in manufacturers],
+                                    value='All',
+                                    clearable=False,
+                                    className="mb-3"
+                                )
+                            ], width=3),
+                            dbc.Col([
+                                html.Label("Brand/Series Name:", className="fw-bold"),
+                                dcc.Dropdown(
+                                    id='brand-filter',
+                                    options=[{'label': 'All Brands', 'value': 'All'}],
+                                    value='All',
+                                    clearable=False,
+                                    className="mb-3"
+                                )
+                            ], width=3),
+                            dbc.Col([
+                                html.Label("Model:", className="fw-bold"),
+                                dcc.Dropdown(
+                                    id='model-filter',
+                                    options=[{'label': 'All Models', 'value': 'All'}],
+                                    value='All',
+                                    clearable=False,
+                                    className="mb-3"
+                                )
+                            ], width=3),
+                            dbc.Col([
+                                html.Label("HP Segment:", className="fw-bold"),
+                                dcc.Dropdown(
+                                    id='hp-segment-filter',
+                                    options=[{'label': 'All HP Segments', 'value': 'All'}] + 
+                                            [{'label': h, 'value': h} for h in hp_segments],
+                                    value='All',
+                                    clearable=False,
+                                    className="mb-3"
+                                )
+                            ], width=3)
+                        ]),
                     
-                    # Second row of filters
-                    dbc.Row([
-                        dbc.Col([
-                            html.Label("Imported From:", className="fw-bold"),
-                            dcc.Dropdown(
-                                id='import-country-filter',
-                                options=[{'label': 'All Import Countries', 'value': 'All'}] + 
-                                        [{'label': c, 'value': c} for c in import_countries],
-                                value='All',
-                                clearable=False,
-                                className="mb-3"
-                            )
-                        ], width=4),
-                        dbc.Col([
-                            html.Label("End Destination Country:", className="fw-bold"),
-                            dcc.Dropdown(
-                                id='destination-country-filter',
-                                options=[{'label': 'End Destination Countries', 'value': 'All'}] + 
-                                        [{'label': c, 'value': c} for c in destination_countries],
-                                value='All',
-                                clearable=False,
-                                className="mb-3"
-                            )
-                        ], width=4),
-                        dbc.Col([
-                            html.Label("Year:", className="fw-bold"),
-                            dcc.Dropdown(
-                                id='year-filter',
-                                options=[{'label': 'All Years', 'value': 'All'}] + 
-                                        [{'label': str(y), 'value': y} for y in years],
-                                value='All',
-                                clearable=False,
-                                className="mb-3"
-                            )
-                        ], width=2),
-                        dbc.Col([
-                            html.Label("Month:", className="fw-bold"),
-                            dcc.Dropdown(
-                                id='month-filter',
-                                options=[{'label': 'All Months', 'value': 'All'}] + 
-                                        [{'label': datetime(2024, m, 1).strftime('%B'), 'value': m} for m in months],
-                                value='All',
-                                clearable=False,
-                                className="mb-3"
-                            )
-                        ], width=2)
+                        # Second row of filters
+                        dbc.Row([
+                            dbc.Col([
+                                html.Label("Imported From:", className="fw-bold"),
+                                dcc.Dropdown(
+                                    id='import-country-filter',
+                                    options=[{'label': 'All Import Countries', 'value': 'All'}] + 
+                                            [{'label': c, 'value': c} for c in import_countries],
+                                    value='All',
+                                    clearable=False,
+                                    className="mb-3"
+                                )
+                            ], width=4),
+                            dbc.Col([
+                                html.Label("End Destination Country:", className="fw-bold"),
+                                dcc.Dropdown(
+                                    id='destination-country-filter',
+                                    options=[{'label': 'End Destination Countries', 'value': 'All'}] + 
+                                            [{'label': c, 'value': c} for c in destination_countries],
+                                    value='All',
+                                    clearable=False,
+                                    className="mb-3"
+                                )
+                            ], width=4),
+                            dbc.Col([
+                                html.Label("Year:", className="fw-bold"),
+                                dcc.Dropdown(
+                                    id='year-filter',
+                                    options=[{'label': 'All Years', 'value': 'All'}] + 
+                                            [{'label': str(y), 'value': y} for y in years],
+                                    value='All',
+                                    clearable=False,
+                                    className="mb-3"
+                                )
+                            ], width=2),
+                            dbc.Col([
+                                html.Label("Month:", className="fw-bold"),
+                                dcc.Dropdown(
+                                    id='month-filter',
+                                    options=[{'label': 'All Months', 'value': 'All'}] + 
+                                            [{'label': MONTH_NAME_LOOKUP[m], 'value': m} for m in months],
+                                    value='All',
+                                    clearable=False,
+                                    className="mb-3"
+                                )
+                            ], width=2)
+                        ])
                     ])
-                ])
-            ], className="shadow-sm mb-4")
-        ], width=12)
-    ]),
-    
-    # Summary Cards
-    dbc.Row([
-        dbc.Col([
-            html.Div(id="summary-cards")
-        ], width=12)
-    ], className="mb-4"),
-    
-    # Export Section
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H5([
-                        html.I(className="fas fa-download me-2"),
-                        "Export Filtered Data"
-                    ], className="mb-3"),
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Button([
-                                html.I(className="fas fa-file-csv me-2"),
-                                "Download CSV"
-                            ], id="download-csv-btn", color="success", className="me-2"),
-                            dbc.Button([
-                                html.I(className="fas fa-file-excel me-2"),
-                                "Download Excel"
-                            ], id="download-excel-btn", color="primary")
-                        ], width=6),
-                        dbc.Col([
-                            html.Div(id="download-status", className="text-muted")
-                        ], width=6)
+                ], className="shadow-sm mb-4")
+            ], width=12)
+        ]),
+    
+        # Summary Cards
+        dbc.Row([
+            dbc.Col([
+                html.Div(id="summary-cards")
+            ], width=12)
+        ], className="mb-4"),
+    
+        # Export Section
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H5([
+                            html.I(className="fas fa-download me-2"),
+                            "Export Filtered Data"
+                        ], className="mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Button([
+                                    html.I(className="fas fa-file-csv me-2"),
+                                    "Download CSV"
+                                ], id="download-csv-btn", href=app.get_relative_path('/export/csv'),
+                                   external_link=True, color="success", className="me-2"),
+                                dbc.Button([
+                                    html.I(className="fas fa-file-excel me-2"),
+                                    "Download Excel"
+                                ], id="download-excel-btn", color="primary", className="me-2"),
+                                # Compressed and columnar files for notebooks and other tools
+                                dbc.DropdownMenu([
+                                    dbc.DropdownMenuItem(label, id=f"download-{name}-btn",
+                                                         href=app.get_relative_path(f'/export/{extension}'),
+                                                         external_link=True)
+                                    for name, extension, label in DOWNLOAD_FORMAT_LINKS
+                                ], label="More formats", color="secondary", className="d-inline-block")
+                            ], width=6),
+                            dbc.Col([
+                                html.Div(id="download-status", className="text-muted"),
+                                # The Excel export runs as a background job, polled until its file is ready
+                                dcc.Store(id="export-job"),
+                                dcc.Interval(id="export-job-poll", interval=1000, disabled=True)
+                            ], width=6)
+                        ])
                     ])
-                ])
-            ], className="shadow-sm mb-4")
-        ], width=12)
-    ]),
-    
-    # Charts Section
-    dbc.Row([
-        dbc.Col([
-            html.Div(id="charts-container")
-        ], width=12)
-    ]),
-    
-    # Data Table Section
-    dbc.Row([
-        dbc.Col([
-            html.Div(id="data-table-container")
-        ], width=12)
-    ], className="mt-4"),
-    
-    # Hidden divs for downloads
-    html.Div(id="download-csv", style={"display": "none"}),
-    html.Div(id="download-excel", style={"display": "none"}),
-    
-    # Disclaimer at bottom
-    dbc.Row([
-        dbc.Col([
-            dbc.Alert([
-                html.I(className="fas fa-exclamation-triangle me-2"),
-                html.Strong("Note: This dataset is for illustration purposes only. It does not represent actual data and has no association with real-world datasets.")
-            ], color="danger", className="text-center fst-italic")
-        ], width=12)
-    ], className="mt-4")
-    
-], fluid=True)
-
-# Callback to update brand dropdown based on manufacturer selection
-@app.callback(
-    Output('brand-filter', 'options'),
-    [Input('manufacturer-filter', 'value')]
-)
-def update_brand_dropdown(selected_manufacturer):
-    if selected_manufacturer == 'All':
-        filtered_brands = brands
-    else:
-        filtered_brands = sorted(df[df['Manufacturer Name'] == selected_manufacturer]['Brand Name'].unique())
+                ], className="shadow-sm mb-4")
+            ], width=12)
+        ]),
     
-    return [{'label': 'All Brands', 'value': 'All'}] + [{'label': b, 'value': b} for b in filtered_brands]
-
-# Callback to update model dropdown based on brand selection
-@app.callback(
-    Output('model-filter', 'options'),
-    [Input('manufacturer-filter', 'value'),
-     Input('brand-filter', 'value')]
-)
-def update_model_dropdown(selected_manufacturer, selected_brand):
-    filtered_df = df.copy()
+        # Charts Section
+        dbc.Row([
+            dbc.Col([
+                html.Div(id="charts-container")
+            ], width=12)
+        ]),
+    
+        # Data Table Section (paged, sorted and filtered on the server)
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5([
+                            html.I(className="fas fa-table me-2"),
+                            html.Span(id="data-table-title")
+                        ], className="mb-0")
+                    ]),
+                    dbc.CardBody([
+                        dash_table.DataTable(
+                            id="data-table",
+                            columns=[{"name": col, "id": col,
+                                      "type": "numeric" if col in ('Month', 'Year') else "text"}
+                                     for col in TABLE_COLUMNS],
+                            style_cell={'textAlign': 'left', 'fontSize': 12},
+                            style_header={'backgroundColor': 'rgb(230, 230, 230)', 'fontWeight': 'bold'},
+                            style_data_conditional=[
+                                {
+                                    'if': {'row_index': 'odd'},
+                                    'backgroundColor': 'rgb(248, 248, 248)'
+                                }
+                            ],
+                            page_current=0,
+                            page_size=20,
+                            page_action="custom",
+                            sort_action="custom",
+                            sort_mode="multi",
+                            sort_by=[],
+                            filter_action="custom",
+                            filter_query=""
+                        )
+                    ])
+                ], className="shadow-sm")
+            ], width=12)
+        ], className="mt-4"),
     
-    if selected_manufacturer != 'All':
-        filtered_df = filtered_df[filtered_df['Manufacturer Name'] == selected_manufacturer]
+        # Disclaimer at bottom
+        dbc.Row([
+            dbc.Col([
+                dbc.Alert([
+                    html.I(className="fas fa-exclamation-triangle me-2"),
+                    html.Strong("Note: This dataset is for illustration purposes only. It does not represent actual data and has no association with real-world datasets.")
+                ], color="danger", className="text-center fst-italic")
+            ], width=12)
+        ], className="mt-4"),
     
-    if selected_brand != 'All':
-        filtered_df = filtered_df[filtered_df['Brand Name'] == selected_brand]
+        # Brand and model options per manufacturer, read by the clientside dropdown callbacks
+        dcc.Store(id="option-hierarchy", data=hierarchy if DROPDOWN_CALLBACKS == 'clientside' else None),
     
-    filtered_models = sorted(filtered_df['Model Name'].unique())
+        # Where the clientside summary cards fetch their cells or values
+        dcc.Store(id="summary-card-urls", data=card_urls)
+    
+    ], fluid=True)
+
+app.layout = serve_layout
+
+# Update brand dropdown based on manufacturer selection
+def update_brand_dropdown(selected_manufacturer):
+    get_data()
+    filtered_brands = option_hierarchy.get(selected_manufacturer, {}).get('brands', [])
+    return [{'label': 'All Brands', 'value': 'All'}] + [{'label': b, 'value': b} for b in filtered_brands]
+
+# Update model dropdown based on brand selection
+def update_model_dropdown(selected_manufacturer, selected_brand):
+    get_data()
+    models_by_brand = option_hierarchy.get(selected_manufacturer, {}).get('models', {})
+    filtered_models = models_by_brand.get(selected_brand, [])
     return [{'label': 'All Models', 'value': 'All'}] + [{'label': m, 'value': m} for m in filtered_models]
 
-# Callback to update summary cards
-@app.callback(
-    Output("summary-cards", "children"),
-    [Input("manufacturer-filter", "value"),
-     Input("brand-filter", "value"),
-     Input("model-filter", "value"),
-     Input("hp-segment-filter", "value"),
-     Input("import-country-filter", "value"),
-     Input("destination-country-filter", "value"),
-     Input("year-filter", "value"),
-     Input("month-filter", "value")]
-)
+# Both dropdowns are answered from the option hierarchy; in clientside mode the
+# browser does the lookup (assets/dropdowns.js) and no request reaches the server
+if DROPDOWN_CALLBACKS == 'clientside':
+    app.clientside_callback(
+        ClientsideFunction(namespace='dropdowns', function_name='brandOptions'),
+        Output('brand-filter', 'options'),
+        [Input('manufacturer-filter', 'value'),
+         Input('option-hierarchy', 'data')]
+    )
+    app.clientside_callback(
+        ClientsideFunction(namespace='dropdowns', function_name='modelOptions'),
+        Output('model-filter', 'options'),
+        [Input('manufacturer-filter', 'value'),
+         Input('brand-filter', 'value'),
+         Input('option-hierarchy', 'data')]
+    )
+else:
+    app.callback(
+        Output('brand-filter', 'options'),
+        [Input('manufacturer-filter', 'value')]
+    )(update_brand_dropdown)
+    app.callback(
+        Output('model-filter', 'options'),
+        [Input('manufacturer-filter', 'value'),
+         Input('brand-filter', 'value')]
+    )(update_model_dropdown)
+
+def summary_card_values(manufacturer, brand, model, hp_segment,
+                        import_country, destination_country, year, month):
+    """The numbers on the summary cards for a filter state, or None when no row matches"""
+    # Apply filters to the aggregate cube
+    cells = get_cube_cells(manufacturer, brand, model, hp_segment,
+                           import_country, destination_country, year, month, CARD_DIMENSIONS)
+    note_rows(int(cells['Rows'].sum()))
+    if cells.empty:
+        return None
+    return {
+        'manufacturers': int(cells['Manufacturer Name'].nunique()),
+        'models': int(cells['Model Name'].nunique()),
+        'price_min': cube_mean(cells, 'Price_Min'),
+        'price_max': cube_mean(cells, 'Price_Max'),
+        'sales_min': cube_mean(cells, 'Sales_Min'),
+        'sales_max': cube_mean(cells, 'Sales_Max'),
+    }
+
+# Update summary cards based on filter selections
 def update_summary_cards(manufacturer, brand, model, hp_segment, 
                         import_country, destination_country, year, month):
     """Update summary cards based on filter selections"""
+    values = summary_card_values(manufacturer, brand, model, hp_segment,
+                                 import_country, destination_country, year, month)
     
-    # Apply filters
-    filtered_df = apply_filters(df, manufacturer, brand, model, hp_segment, 
-                              import_country, destination_country, year, month)
-    
-    if filtered_df.empty:
+    if values is None:
         return html.Div([
             dbc.Alert("No data matches the selected filters. Please adjust your filter criteria.", color="warning")
         ])
     
     # Calculate summary metrics
-    total_records = len(filtered_df)
-    unique_manufacturers = filtered_df['Manufacturer Name'].nunique()
-    unique_models = filtered_df['Model Name'].nunique()
-    avg_price_min = filtered_df['Price_Min'].mean()
-    avg_price_max = filtered_df['Price_Max'].mean()
-    avg_sales_min = filtered_df['Sales_Min'].mean()
-    avg_sales_max = filtered_df['Sales_Max'].mean()
-    total_sales_min = filtered_df['Sales_Min'].sum()
-    total_sales_max = filtered_df['Sales_Max'].sum()
+    unique_manufacturers = values['manufacturers']
+    unique_models = values['models']
+    avg_price_min, avg_price_max = values['price_min'], values['price_max']
+    avg_sales_min, avg_sales_max = values['sales_min'], values['sales_max']
     
     cards = [
         dbc.Card([
@@ -525,6 +1418,89 @@ def update_summary_cards(manufacturer, brand, model, hp_segment,
         dbc.Col(card, width=3, className="mb-3") for card in cards
     ], justify="center")
 
+# Largest number of cells sent to the browser for the clientside summary cards.
+# Above it the browser asks /summary-cards/values for each filter state instead.
+SUMMARY_CARD_CELLS_MAX = int(os.environ.get('SUMMARY_CARD_CELLS_MAX', 20000))
+
+def encode_card_cells(frame):
+    """The card cells of `frame` as (ETag, JSON body, gzipped body), or None when there are too many"""
+    # This grain is only needed here, so it is not kept among the roll-ups
+    cube = build_cube(frame, FILTER_COLUMNS)
+    if len(cube) > SUMMARY_CARD_CELLS_MAX:
+        return None
+    body = json.dumps(build_card_cells(cube), separators=(',', ':')).encode()
+    return (hashlib.sha256(body).hexdigest()[:32], body,
+            gzip.compress(body, compresslevel=COMPRESS_LEVEL, mtime=0))
+
+def summary_card_urls():
+    """URLs for the clientside summary cards: the cells (None when not shipped) and the per-state values"""
+    cells = card_cells
+    return {
+        # Carries the ETag, so the browser can keep the cells until the data changes
+        'cells': app.get_relative_path(f"/summary-cards/cells?v={cells[0]}") if cells else None,
+        'values': app.get_relative_path("/summary-cards/values"),
+    }
+
+@app.server.route('/summary-cards/cells')
+def summary_cards_cells():
+    """The encoded card cells; 404 when the dataset has too many of them to ship"""
+    get_data()
+    cells = card_cells
+    if cells is None:
+        return {'error': 'summary card cells are not available'}, 404
+    etag, body, compressed = cells
+    if etag in request.if_none_match:
+        return Response(status=304, headers={'ETag': f'"{etag}"'})
+    
+    # Compressed here once per dataset; compress_response leaves ETagged responses alone
+    gzipped = bool(request.accept_encodings['gzip'])
+    response = Response(compressed if gzipped else body, mimetype='application/json')
+    if gzipped:
+        response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    if request.args.get('v') == etag:
+        response.cache_control.public = True
+        response.cache_control.max_age = 365 * 24 * 3600
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response
+
+@app.server.route('/summary-cards/values')
+def summary_cards_values():
+    """Summary card values for the filters in the query string (the export parameter names)"""
+    try:
+        filters = filters_from_args(request.args)
+    except ValueError:
+        return {'error': 'year and month must be integers'}, 400
+    values = summary_card_values(*filters)
+    if values is not None:
+        # JSON has no NaN; a mean over no values is sent as null
+        values = {name: None if isinstance(value, float) and np.isnan(value) else value
+                  for name, value in values.items()}
+    return {'values': values}, 200
+
+# In clientside mode the browser renders the same cards (assets/summary_cards.js)
+# from the cells at summary-card-urls, fetched once per dataset, or from the
+# values route when the cells are not shipped
+SUMMARY_CARD_INPUTS = [Input("manufacturer-filter", "value"),
+                       Input("brand-filter", "value"),
+                       Input("model-filter", "value"),
+                       Input("hp-segment-filter", "value"),
+                       Input("import-country-filter", "value"),
+                       Input("destination-country-filter", "value"),
+                       Input("year-filter", "value"),
+                       Input("month-filter", "value")]
+if SUMMARY_CARDS_CALLBACK == 'clientside':
+    app.clientside_callback(
+        ClientsideFunction(namespace='summaryCards', function_name='render'),
+        Output("summary-cards", "children"),
+        SUMMARY_CARD_INPUTS + [Input("summary-card-urls", "data")]
+    )
+else:
+    app.callback(Output("summary-cards", "children"), SUMMARY_CARD_INPUTS)(update_summary_cards)
+
 # Callback to update charts
 @app.callback(
     Output("charts-container", "children"),
@@ -540,72 +1516,84 @@ def update_summary_cards(manufacturer, brand, model, hp_segment,
 def update_charts(manufacturer, brand, model, hp_segment, 
                  import_country, destination_country, year, month):
     """Update charts based on filter selections"""
+    filters = (manufacturer, brand, model, hp_segment,
+               import_country, destination_country, year, month)
     
-    # Apply filters
-    filtered_df = apply_filters(df, manufacturer, brand, model, hp_segment, 
-                              import_country, destination_country, year, month)
-    
-    if filtered_df.empty:
+    frame, positions, version = select_snapshot(*filters)
+    note_rows(len(frame) if positions is None else len(positions))
+    if positions is not None and len(positions) == 0:
         return html.Div([
             dbc.Alert("No data matches the selected filters. Please adjust your filter criteria.", color="warning")
         ])
     
+    # Figures are deterministic per filter state, so serve repeat views from the cache.
+    # They are built from this version's data or a newer one; a newer one is only
+    # ever cached under an older key that no request asks for again.
+    key = (version, filters)
+    figures_json = figure_cache.get(key)
+    if figures_json is None:
+        figures = build_chart_figures(*filters)
+        figures_json = '[' + ','.join(fig.to_json() for fig in figures) + ']'
+        figure_cache.put(key, figures_json)
+    
+    return dbc.Row([
+        dbc.Col(dcc.Graph(figure=figure, className="shadow-sm"), width=6, className="mb-4")
+        for figure in json.loads(figures_json)
+    ], justify="center")
+
+# The parts of plotly_white the charts use. The full template also styles 3D,
+# polar, ternary, geo and map axes and some forty trace types, about 7.5 KB
+# that every figure sent to the browser repeated.
+CHART_TEMPLATE = 'dashboard'
+CHART_TEMPLATE_LAYOUT = ('autotypenumbers', 'colorway', 'font', 'hovermode', 'hoverlabel',
+                         'paper_bgcolor', 'plot_bgcolor', 'title', 'xaxis', 'yaxis')
+CHART_TEMPLATE_TRACES = ('bar', 'pie', 'scatter', 'scattergl')
+
+def register_chart_template():
+    """Register CHART_TEMPLATE with plotly, cut down from plotly_white"""
+    import plotly.io as pio
+    
+    if CHART_TEMPLATE not in pio.templates:
+        white = pio.templates['plotly_white'].to_plotly_json()
+        pio.templates[CHART_TEMPLATE] = {
+            'layout': {key: white['layout'][key] for key in CHART_TEMPLATE_LAYOUT},
+            'data': {trace: white['data'][trace] for trace in CHART_TEMPLATE_TRACES},
+        }
+
+def build_chart_figures(manufacturer, brand, model, hp_segment,
+                        import_country, destination_country, year, month):
+    """Build the four dashboard figures for a filter state"""
+    # plotly express takes about half a second to import; only chart builds need it
+    import plotly.express as px
+    register_chart_template()
+    
+    filtered_df = get_filtered_data(manufacturer, brand, model, hp_segment,
+                                    import_country, destination_country, year, month)
+    
     charts = []
     
+    # Aggregate charts are answered from the cube; only the scatter needs raw rows
+    cells = get_cube_cells(manufacturer, brand, model, hp_segment,
+                           import_country, destination_country, year, month, CHART_DIMENSIONS)
+    
     # 1. Monthly Sales Chart - Sales by month
-    monthly_data = filtered_df.groupby(['Month', 'Manufacturer Name'])['Sales_Min'].sum().reset_index()
-    # Convert month numbers to month names
-    monthly_data['Month_Name'] = monthly_data['Month'].apply(lambda x: datetime(2024, x, 1).strftime('%B'))
+    monthly_sales = cells.groupby(['Manufacturer Name', 'Month'], observed=True)['Sales_Min_sum'].sum()
     
-    # Handle month filtering logic
-    if month == 'All':
-        # Show all months - ensure we have data for all months
-        all_months = list(range(1, 13))
-        manufacturers = monthly_data['Manufacturer Name'].unique()
-        complete_data = []
-        
-        for manufacturer in manufacturers:
-            manufacturer_data = monthly_data[monthly_data['Manufacturer Name'] == manufacturer]
-            for m in all_months:
-                month_name = datetime(2024, m, 1).strftime('%B')
-                existing_data = manufacturer_data[manufacturer_data['Month'] == m]
-                if len(existing_data) > 0:
-                    complete_data.append({
-                        'Month': m,
-                        'Manufacturer Name': manufacturer,
-                        'Sales_Min': existing_data['Sales_Min'].iloc[0],
-                        'Month_Name': month_name
-                    })
-                else:
-                    # Add zero sales for missing months
-                    complete_data.append({
-                        'Month': m,
-                        'Manufacturer Name': manufacturer,
-                        'Sales_Min': 0,
-                        'Month_Name': month_name
-                    })
-        
-        monthly_data = pd.DataFrame(complete_data)
-    else:
-        # Show only the selected month - filter the data to show only that month
-        selected_month = int(month)
-        monthly_data = monthly_data[monthly_data['Month'] == selected_month]
-        
-        # If no data for the selected month, create empty data structure
-        if monthly_data.empty:
-            manufacturers = filtered_df['Manufacturer Name'].unique()
-            month_name = datetime(2024, selected_month, 1).strftime('%B')
-            monthly_data = pd.DataFrame([{
-                'Month': selected_month,
-                'Manufacturer Name': manufacturer,
-                'Sales_Min': 0,
-                'Month_Name': month_name
-            } for manufacturer in manufacturers])
+    # One row per manufacturer and shown month (all twelve, or the selected one),
+    # with zero sales filled in for months that have no data
+    shown_months = list(range(1, 13)) if month == 'All' else [int(month)]
+    monthly_data = (monthly_sales.unstack('Month', fill_value=0)
+                    .reindex(columns=shown_months, fill_value=0)
+                    .stack()
+                    .rename('Sales_Min')
+                    .reset_index())
+    monthly_data['Manufacturer Name'] = monthly_data['Manufacturer Name'].astype(str)
+    monthly_data['Month_Name'] = MONTH_NAME_LOOKUP[monthly_data['Month'].to_numpy()]
     
     # Determine chart type, title and configuration based on month filter
     if month == 'All':
         chart_title = "Monthly Tractor Sales (in units)"
-        xaxis_config = {'categoryorder': 'array', 'categoryarray': ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']}
+        xaxis_config = {'categoryorder': 'array', 'categoryarray': MONTH_NAMES}
         
         # Create line chart for all months
         fig_time = px.line(
@@ -615,10 +1603,10 @@ def update_charts(manufacturer, brand, model, hp_segment,
             color='Manufacturer Name',
             title=chart_title,
             labels={'Sales_Min': 'Monthly Tractor Sales Volume (in units)', 'Month_Name': 'Month'},
-            template="plotly_white"
+            template=CHART_TEMPLATE
         )
     else:
-        selected_month_name = datetime(2024, int(month), 1).strftime('%B')
+        selected_month_name = MONTH_NAME_LOOKUP[int(month)]
         chart_title = f"Sales by Manufacturer - {selected_month_name}"
         
         # Create bar chart for specific month - show manufacturers on x-axis
@@ -629,7 +1617,7 @@ def update_charts(manufacturer, brand, model, hp_segment,
             color='Manufacturer Name',
             title=chart_title,
             labels={'Sales_Min': f'Tractor Sales Volume in {selected_month_name} (units)', 'Manufacturer Name': 'Manufacturer'},
-            template="plotly_white"
+            template=CHART_TEMPLATE
         )
         xaxis_config = {}
     
@@ -643,20 +1631,25 @@ def update_charts(manufacturer, brand, model, hp_segment,
         yaxis=dict(tickfont=dict(size=9)),
         showlegend=True if month == 'All' else False  # Hide legend for single month bar chart
     )
-    charts.append(dcc.Graph(figure=fig_time, className="shadow-sm"))
+    charts.append(fig_time)
     
     # 2. Price vs HP Scatter Plot
+    # Large selections are aggregated per model and month and drawn with WebGL
+    points, aggregated = scatter_points(filtered_df)
+    # plotly express groups the colour column without observed=True, so plot plain strings
+    scatter_df = points.assign(**{'Manufacturer Name': points['Manufacturer Name'].astype(str)})
     fig_price_hp = px.scatter(
-        filtered_df,
+        scatter_df,
         x='HP_Min',
         y='Price_Min',
         size='Sales_Min',
         color='Manufacturer Name',
         hover_name='Model Name',
-        hover_data=['Brand Name', 'Price_Max', 'Sales_Max'],
-        title="Tractor Price vs Tractor Horsepower Analysis",
+        hover_data=['Brand Name', 'Price_Max', 'Sales_Max'] + (['Year', 'Month', 'Rows'] if aggregated else []),
+        title="Tractor Price vs Tractor Horsepower Analysis" + (" (per model and month)" if aggregated else ""),
         labels={'HP_Min': 'Horsepower (HP)', 'Price_Min': 'Price (US$)'},
-        template="plotly_white"
+        render_mode='webgl' if aggregated else 'auto',
+        template=CHART_TEMPLATE
     )
     fig_price_hp.update_layout(
         height=400,
@@ -667,15 +1660,15 @@ def update_charts(manufacturer, brand, model, hp_segment,
         xaxis=dict(tickfont=dict(size=9)),
         yaxis=dict(tickfont=dict(size=9))
     )
-    charts.append(dcc.Graph(figure=fig_price_hp, className="shadow-sm"))
+    charts.append(fig_price_hp)
     
     # 3. Manufacturer Market Share
-    manufacturer_sales = filtered_df.groupby('Manufacturer Name')['Sales_Min'].sum().sort_values(ascending=False)
+    manufacturer_sales = cells.groupby('Manufacturer Name', observed=True)['Sales_Min_sum'].sum().sort_values(ascending=False)
     fig_manufacturer = px.pie(
         values=manufacturer_sales.values,
         names=manufacturer_sales.index,
         title="Market Share by Tractor Manufacturers (Units, Percentage)",
-        template="plotly_white"
+        template=CHART_TEMPLATE
     )
     fig_manufacturer.update_layout(
         height=400,
@@ -684,16 +1677,16 @@ def update_charts(manufacturer, brand, model, hp_segment,
         font=dict(size=10),
         title_font_size=16
     )
-    charts.append(dcc.Graph(figure=fig_manufacturer, className="shadow-sm"))
+    charts.append(fig_manufacturer)
     
     # 4. HP Category Distribution
-    hp_category_counts = filtered_df['HP_Category'].value_counts()
+    hp_category_counts = cells.groupby('HP_Category', observed=False)['Rows'].sum().sort_values(ascending=False)
     fig_hp_category = px.bar(
         x=hp_category_counts.index,
         y=hp_category_counts.values,
         title="Distribution by HP Category",
         labels={'x': 'HP Category', 'y': 'Number of Tractor Sold (Unit)'},
-        template="plotly_white"
+        template=CHART_TEMPLATE
     )
     fig_hp_category.update_layout(
         height=400,
@@ -705,15 +1698,16 @@ def update_charts(manufacturer, brand, model, hp_segment,
         xaxis=dict(tickfont=dict(size=9)),
         yaxis=dict(tickfont=dict(size=9))
     )
-    charts.append(dcc.Graph(figure=fig_hp_category, className="shadow-sm"))
+    charts.append(fig_hp_category)
     
-    return dbc.Row([
-        dbc.Col(chart, width=6, className="mb-4") for chart in charts
-    ], justify="center")
+    return charts
 
-# Callback to update data table
+# Callback to serve one page of the data table
 @app.callback(
-    Output("data-table-container", "children"),
+    [Output("data-table", "data"),
+     Output("data-table", "page_count"),
+     Output("data-table", "page_current"),
+     Output("data-table-title", "children")],
     [Input("manufacturer-filter", "value"),
      Input("brand-filter", "value"),
      Input("model-filter", "value"),
@@ -721,65 +1715,42 @@ def update_charts(manufacturer, brand, model, hp_segment,
      Input("import-country-filter", "value"),
      Input("destination-country-filter", "value"),
      Input("year-filter", "value"),
-     Input("month-filter", "value")]
+     Input("month-filter", "value"),
+     Input("data-table", "page_current"),
+     Input("data-table", "page_size"),
+     Input("data-table", "sort_by"),
+     Input("data-table", "filter_query")]
 )
 def update_data_table(manufacturer, brand, model, hp_segment, 
-                      import_country, destination_country, year, month):
-    """Update data table based on filter selections"""
-    
-    # Apply filters
-    filtered_df = apply_filters(df, manufacturer, brand, model, hp_segment, 
-                              import_country, destination_country, year, month)
-    
-    if filtered_df.empty:
-        return html.Div([
-            dbc.Alert("No data matches the selected filters. Please adjust your filter criteria.", color="warning")
-        ])
-    
-    # Prepare data for table (limit to first 1000 records for performance)
-    display_df = filtered_df.head(1000)
+                      import_country, destination_country, year, month,
+                      page_current=0, page_size=20, sort_by=None, filter_query=''):
+    """Update data table based on filter selections.
+
+    Sorting and the table's own column filters are evaluated here against
+    the full filtered result, and only the requested page is sent.
+    """
+    filters = (manufacturer, brand, model, hp_segment,
+               import_country, destination_country, year, month)
+    sort_key = tuple((item['column_id'], item['direction']) for item in sort_by or [])
+    frame, rows = query_table_rows(filters, sort_key, filter_query or '')
+    note_rows(len(rows))
     
-    # Select columns to display
-    table_columns = [
-        'Manufacturer Name', 'Brand Name', 'Model Name', 'HP Segment',
-        'Dollar Value of Tractor (ASP Range in US$)', 'Monthly Sale Data (Units)',
-        'Imported From (Country Name)', 'End Destination Country', 'Month', 'Year'
-    ]
+    if len(rows) == 0:
+        return [], 1, 0, "No data matches the selected filters. Please adjust your filter criteria."
     
-    table_data = display_df[table_columns].to_dict('records')
-    
-    table = dash_table.DataTable(
-        data=table_data,
-        columns=[{"name": col, "id": col} for col in table_columns],
-        style_cell={'textAlign': 'left', 'fontSize': 12},
-        style_header={'backgroundColor': 'rgb(230, 230, 230)', 'fontWeight': 'bold'},
-        style_data_conditional=[
-            {
-                'if': {'row_index': 'odd'},
-                'backgroundColor': 'rgb(248, 248, 248)'
-            }
-        ],
-        page_size=20,
-        sort_action="native",
-        filter_action="native",
-        export_format="csv"
-    )
+    page_size = page_size or 20
+    page_count = -(-len(rows) // page_size)
+    page_current = min(page_current or 0, page_count - 1)
+    page_rows = rows[page_current * page_size:(page_current + 1) * page_size]
+    table_data = with_display_columns(frame.iloc[page_rows])[TABLE_COLUMNS].to_dict('records')
     
-    return dbc.Card([
-        dbc.CardHeader([
-            html.H5([
-                html.I(className="fas fa-table me-2"),
-                f"Filtered Data Table ({len(display_df):,} records shown)"
-            ], className="mb-0")
-        ]),
-        dbc.CardBody([table])
-    ], className="shadow-sm")
+    return table_data, page_count, page_current, f"Filtered Data Table ({len(rows):,} records)"
 
-# Callback for CSV download
+# Callback to point the export links at the export routes for the current filters
 @app.callback(
-    Output("download-csv", "children"),
-    [Input("download-csv-btn", "n_clicks"),
-     Input("manufacturer-filter", "value"),
+    [Output("download-csv-btn", "href")] +
+    [Output(f"download-{name}-btn", "href") for name, _, _ in DOWNLOAD_FORMAT_LINKS],
+    [Input("manufacturer-filter", "value"),
      Input("brand-filter", "value"),
      Input("model-filter", "value"),
      Input("hp-segment-filter", "value"),
@@ -788,82 +1759,1145 @@ def update_data_table(manufacturer, brand, model, hp_segment,
      Input("year-filter", "value"),
      Input("month-filter", "value")]
 )
-def download_csv(n_clicks, manufacturer, brand, model, hp_segment, 
-                import_country, destination_country, year, month):
-    """Handle CSV download"""
-    if n_clicks:
-        # Apply filters
-        filtered_df = apply_filters(df, manufacturer, brand, model, hp_segment, 
-                                  import_country, destination_country, year, month)
-        
-        # Convert to CSV
-        csv_string = filtered_df.to_csv(index=False)
-        csv_b64 = base64.b64encode(csv_string.encode()).decode()
-        
-        return dcc.Download(
-            id="download-csv-file",
-            data=dict(content=csv_string, filename=f"tractor_data_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
-        )
-    return ""
+def update_export_links(manufacturer, brand, model, hp_segment,
+                        import_country, destination_country, year, month):
+    """Build the export URLs; nothing is serialized until a link is followed"""
+    query = export_query(manufacturer, brand, model, hp_segment,
+                         import_country, destination_country, year, month)
+    suffix = f"?{query}" if query else ""
+    return ([app.get_relative_path('/export/csv') + suffix] +
+            [app.get_relative_path(f'/export/{extension}') + suffix
+             for _, extension, _ in DOWNLOAD_FORMAT_LINKS])
 
-# Callback for Excel download
+# Callback to run the Excel export as a background job and report its progress
 @app.callback(
-    Output("download-excel", "children"),
+    [Output("export-job", "data"),
+     Output("export-job-poll", "disabled"),
+     Output("download-status", "children")],
     [Input("download-excel-btn", "n_clicks"),
-     Input("manufacturer-filter", "value"),
-     Input("brand-filter", "value"),
-     Input("model-filter", "value"),
-     Input("hp-segment-filter", "value"),
-     Input("import-country-filter", "value"),
-     Input("destination-country-filter", "value"),
-     Input("year-filter", "value"),
-     Input("month-filter", "value")]
+     Input("export-job-poll", "n_intervals")],
+    [State("manufacturer-filter", "value"),
+     State("brand-filter", "value"),
+     State("model-filter", "value"),
+     State("hp-segment-filter", "value"),
+     State("import-country-filter", "value"),
+     State("destination-country-filter", "value"),
+     State("year-filter", "value"),
+     State("month-filter", "value"),
+     State("export-job", "data")],
+    prevent_initial_call=True
 )
-def download_excel(n_clicks, manufacturer, brand, model, hp_segment, 
-                  import_country, destination_country, year, month):
-    """Handle Excel download"""
-    if n_clicks:
-        # Apply filters
-        filtered_df = apply_filters(df, manufacturer, brand, model, hp_segment, 
-                                  import_country, destination_country, year, month)
-        
-        # Convert to Excel
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            filtered_df.to_excel(writer, sheet_name='Filtered Data', index=False)
-        
-        excel_data = output.getvalue()
-        excel_b64 = base64.b64encode(excel_data).decode()
-        
-        return dcc.Download(
-            id="download-excel-file",
-            data=dict(content=excel_b64, filename=f"tractor_data_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
-        )
-    return ""
+def update_export_job(n_clicks, n_intervals, manufacturer, brand, model, hp_segment,
+                      import_country, destination_country, year, month, job_id):
+    """Start an Excel export job on click, then poll it until its file is ready"""
+    if ctx.triggered_id == "download-excel-btn":
+        try:
+            job = submit_export_job((manufacturer, brand, model, hp_segment,
+                                     import_country, destination_country, year, month), 'xlsx')
+        except ValueError as e:
+            return None, True, dbc.Alert(str(e), color="warning", className="mb-0 py-2")
+        note_rows(job['rows'])
+    else:
+        job = read_job(job_id) if job_id else None
+        if job is None:
+            return None, True, "The export has expired; please start it again."
+    
+    return job['id'], job['status'] in ('done', 'failed'), export_job_progress(job)
+
+def export_job_progress(job):
+    """Progress bar, download link or error for an export job"""
+    if job['status'] == 'done':
+        return html.A([
+            html.I(className="fas fa-file-excel me-2"),
+            f"Excel file ready ({job['rows']:,} rows) - download"
+        ], href=export_job_status(job)['file_url'], className="fw-bold")
+    if job['status'] == 'failed':
+        return dbc.Alert(f"Export failed: {job['error']}", color="danger", className="mb-0 py-2")
+    
+    percent = int(100 * job['rows_written'] / job['rows']) if job['rows'] else 100
+    return html.Div([
+        html.Small(f"Preparing Excel file: {job['rows_written']:,} of {job['rows']:,} rows"),
+        dbc.Progress(value=percent, label=f"{percent}%", striped=True, animated=True)
+    ])
 
 def apply_filters(df, manufacturer, brand, model, hp_segment, 
                  import_country, destination_country, year, month):
-    """Apply all filters to the dataframe"""
-    filtered_df = df.copy()
-    
-    if manufacturer != 'All':
-        filtered_df = filtered_df[filtered_df['Manufacturer Name'] == manufacturer]
-    if brand != 'All':
-        filtered_df = filtered_df[filtered_df['Brand Name'] == brand]
-    if model != 'All':
-        filtered_df = filtered_df[filtered_df['Model Name'] == model]
-    if hp_segment != 'All':
-        filtered_df = filtered_df[filtered_df['HP Segment'] == hp_segment]
-    if import_country != 'All':
-        filtered_df = filtered_df[filtered_df['Imported From (Country Name)'] == import_country]
-    if destination_country != 'All':
-        filtered_df = filtered_df[filtered_df['End Destination Country'] == destination_country]
-    if year != 'All':
-        filtered_df = filtered_df[filtered_df['Year'] == year]
-    if month != 'All':
-        filtered_df = filtered_df[filtered_df['Month'] == month]
-    
-    return filtered_df
+    """Apply all filters to the dataframe.
+
+    Uses the prebuilt filter index when `df` is the loaded dataset and builds
+    one on the fly for any other frame, without loading the dataset; the
+    returned frame only copies matching rows.
+    """
+    started = time.perf_counter()
+    index = globals().get('filter_index')
+    if index is None or df is not index.df:
+        index = FilterIndex(df)
+    positions = index.select(manufacturer, brand, model, hp_segment,
+                             import_country, destination_country, year, month)
+    request_metrics.observe('apply_filters', time.perf_counter() - started,
+                            rows=len(df) if positions is None else len(positions))
+    if positions is None:
+        return df
+    return df.iloc[positions]
+
+def dataset_snapshot():
+    """The loaded dataset, its filter index and its version, read together"""
+    get_data()
+    with _data_lock:
+        return df, filter_index, dataset_version
+
+@lru_cache(maxsize=32)
+def select_index_rows(index, filters):
+    """Row positions of `index.df` matching a filter tuple (None when no filter is active).
+
+    Cached per index and filter tuple, so the summary cards, charts, table
+    and exports triggered by one dropdown change share a single filter
+    evaluation. Each dataset version has its own index, so a selection
+    computed while a new dataset is published is never served for it.
+    """
+    started = time.perf_counter()
+    positions = index.select(*filters)
+    request_metrics.observe('apply_filters', time.perf_counter() - started,
+                            rows=index.n_rows if positions is None else len(positions))
+    if positions is not None:
+        positions.setflags(write=False)
+    return positions
+
+def select_snapshot(manufacturer, brand, model, hp_segment,
+                    import_country, destination_country, year, month):
+    """The loaded dataset, the positions of its rows matching a filter state, and its version"""
+    frame, index, version = dataset_snapshot()
+    positions = select_index_rows(index, (manufacturer, brand, model, hp_segment,
+                                          import_country, destination_country, year, month))
+    return frame, positions, version
+
+def select_rows(manufacturer, brand, model, hp_segment,
+                import_country, destination_country, year, month):
+    """Row positions of the loaded dataset matching a filter state (None when no filter is active)"""
+    return select_snapshot(manufacturer, brand, model, hp_segment,
+                           import_country, destination_country, year, month)[1]
+
+def get_cube_cells(manufacturer, brand, model, hp_segment,
+                   import_country, destination_country, year, month, dimensions):
+    """Aggregate cube cells matching a filter state, keyed by the filtered columns and `dimensions`"""
+    get_data()
+    return rollups.cells((manufacturer, brand, model, hp_segment,
+                          import_country, destination_country, year, month), dimensions)
+
+def get_filtered_data(manufacturer, brand, model, hp_segment,
+                      import_country, destination_country, year, month):
+    """Rows of the loaded dataset matching a filter state"""
+    frame, positions, _ = select_snapshot(manufacturer, brand, model, hp_segment,
+                                          import_country, destination_country, year, month)
+    if positions is None:
+        return frame
+    return frame.iloc[positions]
+
+class FigureCache:
+    """Thread-safe LRU of serialized figure JSON, bounded by total size in bytes"""
+    
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key):
+        """Cached JSON for a key, or None (counts a hit or a miss)"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key, value):
+        """Store JSON for a key, evicting least recently used entries to stay in budget"""
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = value
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+    
+    def clear(self):
+        """Drop every entry, keeping the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def stats(self):
+        """Counters and current size, for monitoring"""
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._bytes,
+                    'max_bytes': self.max_bytes, 'hits': self.hits,
+                    'misses': self.misses, 'evictions': self.evictions}
+
+# Serialized chart figures, keyed by (dataset_version, filter tuple)
+FIGURE_CACHE_BYTES = int(float(os.environ.get('FIGURE_CACHE_MB', 64)) * 1024 * 1024)
+figure_cache = FigureCache(FIGURE_CACHE_BYTES)
+
+def set_dataset(frame):
+    """Replace the loaded dataset, rebuilding its index and cube and invalidating every cache.
+
+    Everything is built before any global is swapped, so callbacks running
+    during a reload see either the old dataset or the new one.
+    """
+    new_index = FilterIndex(frame)
+    publish_dataset(frame, new_index, CubeRollups(frame, new_index))
+
+def publish_dataset(frame, new_index, new_rollups):
+    """Swap in a dataset with its row index and cube roll-ups, derive the rest and clear the caches"""
+    global df, filter_index, rollups, option_hierarchy, card_cells, filter_options, dataset_version
+    new_hierarchy = build_option_hierarchy(new_rollups.cube(HIERARCHY_DIMENSIONS))
+    # The grains of the unfiltered page, so the first page load finds them built
+    new_rollups.cube(CARD_DIMENSIONS)
+    new_rollups.cube(CHART_DIMENSIONS)
+    new_card_cells = encode_card_cells(frame) if SUMMARY_CARDS_CALLBACK == 'clientside' else None
+    new_options = {column: new_index.values(column) for column in FILTER_COLUMNS}
+    with _data_lock:
+        df, filter_index, rollups, option_hierarchy, card_cells, filter_options = (
+            frame, new_index, new_rollups, new_hierarchy, new_card_cells, new_options)
+        dataset_version += 1
+        select_index_rows.cache_clear()
+        _query_table_rows.cache_clear()
+        figure_cache.clear()
+
+def append_rows(rows):
+    """Append rows in the typed schema, with Month and Year, to the loaded dataset.
+
+    The rows get the derived columns and the dataset's dtypes. The filter
+    index is extended and the new rows' cubes merged into the existing roll-ups
+    rather than rebuilt; the version is bumped and every cache cleared as on
+    a reload. Returns the number of rows added.
+    """
+    missing = [column for column in FILTER_COLUMNS + CUBE_MEASURES if column not in rows.columns]
+    if missing:
+        raise ValueError(f"missing columns: {', '.join(missing)}")
+    rows = add_derived_columns(rows.reset_index(drop=True))
+    with _data_lock:
+        get_data()
+        current, added = align_frames(df, rows)
+        frame = pd.concat([current, added], ignore_index=True)
+        new_index = filter_index.extend(frame)
+        publish_dataset(frame, new_index, rollups.extend(frame, new_index, added))
+    logger.info("Appended %d rows; dataset now has %d rows (version %d)", len(added), len(frame), dataset_version)
+    return len(added)
+
+# Monthly extracts appended at runtime are kept here, so every worker (and any
+# restarted one) applies the same files in name order on top of the base data
+INGEST_DIR = os.environ.get('TRACTOR_INGEST_DIR', os.path.join(DATA_CACHE_DIR, 'ingest'))
+INGEST_POLL_SECONDS = float(os.environ.get('TRACTOR_INGEST_POLL_SECONDS', 30))
+_ingested_files = set()
+_last_ingest_poll = 0.0
+
+def sync_ingested():
+    """Append the extracts in INGEST_DIR that this process has not applied yet; returns rows added"""
+    if not os.path.isdir(INGEST_DIR):
+        return 0
+    added = 0
+    for name in sorted(os.listdir(INGEST_DIR)):
+        if not name.endswith('.csv') or name in _ingested_files:
+            continue
+        with _data_lock:
+            if name in _ingested_files:
+                continue
+            # Marked first so a bad file is reported once instead of on every poll
+            _ingested_files.add(name)
+            try:
+                added += append_rows(load_tractor_csv(os.path.join(INGEST_DIR, name)))
+            except (KeyError, ValueError) as e:
+                logger.error("Could not append %s: %s", name, e)
+    return added
+
+@app.server.before_request
+def poll_ingest_dir():
+    global _last_ingest_poll
+    if dataset_version == 0 or time.monotonic() - _last_ingest_poll < INGEST_POLL_SECONDS:
+        return
+    _last_ingest_poll = time.monotonic()
+    sync_ingested()
+
+# Pre-warm at startup (gunicorn master or `python comprehensive_dashboard.py`); 0 loads on first request
+PREWARM = os.environ.get('TRACTOR_PREWARM', '1') != '0'
+
+def warm_up():
+    """Load the dataset and cache the default (unfiltered) view before traffic arrives"""
+    get_data()
+    update_charts(*['All'] * len(FILTER_COLUMNS))
+
+# One clause of a DataTable filter_query, e.g. '{Year} >= 2025' or '{Brand Name} icontains "m5"'
+_FILTER_CLAUSE = re.compile(
+    r'^\s*\{(?P<column>[^}]*)\}\s*(?P<operator>[is]?(?:>=|<=|!=|=|<|>)|[a-z]+)\s*(?P<value>.*?)\s*$')
+_FILTER_OPERATORS = {
+    '>=': 'ge', '<=': 'le', '<': 'lt', '>': 'gt', '!=': 'ne', '=': 'eq',
+    'ge': 'ge', 'le': 'le', 'lt': 'lt', 'gt': 'gt', 'ne': 'ne', 'eq': 'eq',
+    'contains': 'contains', 'datestartswith': 'datestartswith'
+}
+
+def parse_filter_clause(clause):
+    """Parse one DataTable filter_query clause into (column, operator, value, ignore_case).
+
+    Unquoted numeric values are returned as floats. Returns None for clauses
+    that are not understood.
+    """
+    match = _FILTER_CLAUSE.match(clause)
+    if not match:
+        return None
+    operator = match['operator']
+    ignore_case = operator[0] == 'i' and operator[1:] in _FILTER_OPERATORS
+    if operator[0] in 'is' and operator[1:] in _FILTER_OPERATORS:
+        operator = operator[1:]
+    if operator not in _FILTER_OPERATORS:
+        return None
+    
+    value = match['value']
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"', '`'):
+        value = value[1:-1].replace('\\' + value[0], value[0])
+    else:
+        try:
+            value = float(value)
+        except ValueError:
+            pass
+    return match['column'], _FILTER_OPERATORS[operator], value, ignore_case
+
+def _table_column(frame, rows, column):
+    """Values of a table column for the given row positions, formatting range text on demand"""
+    if column in TEXT_COLUMN_SOURCES:
+        return with_display_columns(frame.iloc[rows])[column].reset_index(drop=True)
+    return frame[column].iloc[rows].reset_index(drop=True)
+
+def query_table_rows(filters, sort_key, filter_query):
+    """The loaded dataset and the row positions the data table shows from it.
+
+    Rows pass the dashboard filters, then the table filters, then the sort;
+    `sort_key` is a tuple of (column, 'asc' | 'desc') pairs. Without a table
+    filter or sort the positions are the dashboard selection itself, or a
+    range over the whole table when nothing is filtered, so no position
+    array is built or cached for them.
+    """
+    frame, index, _ = dataset_snapshot()
+    if not sort_key and not filter_query:
+        positions = select_index_rows(index, filters)
+        return frame, range(len(frame)) if positions is None else positions
+    return frame, _query_table_rows(index, filters, sort_key, filter_query)
+
+@lru_cache(maxsize=16)
+def _query_table_rows(index, filters, sort_key, filter_query):
+    """Table-filtered or sorted rows of `index.df`, cached so paging through a result does not repeat the work"""
+    frame = index.df
+    positions = select_index_rows(index, filters)
+    rows = np.arange(len(frame)) if positions is None else positions
+    
+    for clause in filter_query.split(' && ') if filter_query else []:
+        parsed = parse_filter_clause(clause)
+        if parsed is None or parsed[0] not in TABLE_COLUMNS or len(rows) == 0:
+            continue
+        column, operator, value, ignore_case = parsed
+        
+        if operator in ('contains', 'datestartswith'):
+            values = _table_column(frame, rows, column).astype(str)
+            text = str(int(value) if isinstance(value, float) and value.is_integer() else value)
+            if ignore_case:
+                values, text = values.str.lower(), text.lower()
+            mask = (values.str.contains(text, regex=False) if operator == 'contains'
+                    else values.str.startswith(text))
+        else:
+            if column in TEXT_COLUMN_SOURCES and isinstance(value, float):
+                values = frame[TEXT_COLUMN_SOURCES[column]].iloc[rows].reset_index(drop=True)
+            else:
+                values = _table_column(frame, rows, column)
+            if values.dtype == 'category':
+                values = values.astype(str)
+            if ignore_case and isinstance(value, str):
+                values, value = values.str.lower(), value.lower()
+            try:
+                mask = getattr(values, operator)(value)
+            except TypeError:
+                # e.g. a text value typed into a numeric column
+                mask = pd.Series(False, index=values.index)
+        rows = rows[mask.to_numpy(dtype=bool)]
+    
+    for column, direction in reversed(sort_key):
+        if column not in TABLE_COLUMNS or len(rows) == 0:
+            continue
+        values = (frame[TEXT_COLUMN_SOURCES[column]].iloc[rows].reset_index(drop=True)
+                  if column in TEXT_COLUMN_SOURCES else _table_column(frame, rows, column))
+        if values.dtype == 'category':
+            values = values.astype(str)
+        order = values.sort_values(ascending=direction == 'asc', kind='stable').index.to_numpy()
+        rows = rows[order]
+    
+    rows.setflags(write=False)
+    return rows
+
+# Export routes: query parameter names for the eight filters, in apply_filters order
+FILTER_PARAMS = [
+    'manufacturer', 'brand', 'model', 'hp_segment',
+    'import_country', 'destination_country', 'year', 'month'
+]
+
+# Rows serialized per chunk by the streaming exports
+EXPORT_CHUNK_ROWS = int(os.environ.get('EXPORT_CHUNK_ROWS', 50000))
+
+def export_query(*filters):
+    """Encode a filter state as an export query string, omitting 'All' values"""
+    return urlencode({name: value for name, value in zip(FILTER_PARAMS, filters)
+                      if value != 'All'})
+
+def filters_from_args(args):
+    """Decode export query parameters into a filter tuple.
+
+    Raises ValueError when year or month is not an integer.
+    """
+    filters = []
+    for name in FILTER_PARAMS:
+        value = args.get(name, 'All')
+        if name in ('year', 'month') and value != 'All':
+            value = int(value)
+        filters.append(value)
+    return tuple(filters)
+
+def export_filename(extension):
+    return f"tractor_data_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+def iter_row_chunks(frame, positions, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Yield the selected rows of `frame` in slices of at most `chunk_rows`"""
+    total = len(frame) if positions is None else len(positions)
+    for start in range(0, total, chunk_rows):
+        if positions is None:
+            yield frame.iloc[start:start + chunk_rows]
+        else:
+            yield frame.iloc[positions[start:start + chunk_rows]]
+
+def iter_csv(frame, positions):
+    """Yield the selected rows of `frame` as CSV text, one chunk at a time"""
+    yield with_display_columns(frame.head(0)).to_csv(index=False)
+    for chunk in iter_row_chunks(frame, positions):
+        yield with_display_columns(chunk).to_csv(index=False, header=False)
+
+def write_csv(frame, positions, output, progress=None):
+    """Write the selected rows of `frame` as CSV to the binary file `output`.
+
+    `progress`, if given, is called with the rows written so far after each
+    chunk. Returns the number of data rows written.
+    """
+    output.write(with_display_columns(frame.head(0)).to_csv(index=False).encode())
+    rows_written = 0
+    for chunk in iter_row_chunks(frame, positions):
+        output.write(with_display_columns(chunk).to_csv(index=False, header=False).encode())
+        rows_written += len(chunk)
+        if progress is not None:
+            progress(rows_written)
+    return rows_written
+
+# Bump when the export layout changes so stale cached exports are not served
+EXPORT_FORMAT_VERSION = 1
+
+class ExportCache:
+    """On-disk LRU of export files, addressed by a hash of the dataset, format and filters.
+
+    The directory is shared by every worker. A file's mtime is its recency,
+    refreshed on each hit, and the least recently used files are removed
+    once the total size exceeds `max_bytes`. Files are written under a
+    temporary name and renamed into place, so a reader never sees a partial
+    one.
+    """
+    
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def key(fingerprint, export_format, filters):
+        """Cache key for an export; also its ETag, since equal keys mean equal content"""
+        normalized = [EXPORT_FORMAT_VERSION, fingerprint, export_format, [str(value) for value in filters]]
+        return hashlib.sha256(json.dumps(normalized).encode()).hexdigest()
+    
+    def path(self, key, export_format):
+        return os.path.join(self.directory, f"{key}.{export_format}")
+    
+    def open(self, key, export_format):
+        """The cached file opened for reading, or None (counts a hit or a miss).
+
+        Opening it here keeps it readable even if another worker evicts it
+        while it is being sent.
+        """
+        path = self.path(key, export_format)
+        try:
+            handle = open(path, 'rb')
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass  # evicted by another worker since; the open handle still reads it
+        with self._lock:
+            self.hits += 1
+        return handle
+    
+    def partial_path(self, key, export_format):
+        """A unique temporary path to write an export to before commit()"""
+        os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, f".{key}.{uuid.uuid4().hex}.{export_format}.tmp")
+    
+    def commit(self, partial, key, export_format):
+        """Move a finished file from partial_path() into the cache; returns its cached path"""
+        path = self.path(key, export_format)
+        os.replace(partial, path)
+        self.evict(keep=path)
+        return path
+    
+    def store(self, source, key, export_format):
+        """Add a copy of the finished file `source` (a hard link where possible)"""
+        partial = self.partial_path(key, export_format)
+        try:
+            try:
+                os.link(source, partial)
+            except OSError:
+                shutil.copyfile(source, partial)
+            return self.commit(partial, key, export_format)
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+    
+    def _files(self):
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith('.'):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+    
+    def evict(self, keep=None):
+        """Remove the least recently used files until the cache fits in `max_bytes`.
+
+        `keep`, the file just added, is never removed, even if it alone is
+        over budget.
+        """
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue  # evicted by another worker
+            total -= size
+            with self._lock:
+                self.evictions += 1
+    
+    def stats(self):
+        """Counters for this process and the cache's current size, for monitoring"""
+        files = self._files() if os.path.isdir(self.directory) else []
+        with self._lock:
+            return {'entries': len(files), 'bytes': sum(size for _, size, _ in files),
+                    'max_bytes': self.max_bytes, 'hits': self.hits,
+                    'misses': self.misses, 'evictions': self.evictions}
+
+# Export files, keyed by dataset fingerprint, format and filter tuple
+EXPORT_CACHE_DIR = os.environ.get('EXPORT_CACHE_DIR', os.path.join(DATA_CACHE_DIR, 'export-cache'))
+EXPORT_CACHE_BYTES = int(float(os.environ.get('EXPORT_CACHE_MB', 512)) * 1024 * 1024)
+export_cache = ExportCache(EXPORT_CACHE_DIR, EXPORT_CACHE_BYTES)
+
+_fingerprint = (0, None)
+
+def export_source():
+    """The loaded dataset, its filter index and a hash of its content, read together.
+
+    The hash keys the export cache. It is computed on the first export of
+    each dataset version and, unlike the version, is the same in every
+    worker and across restarts for the same data.
+    """
+    global _fingerprint
+    get_data()
+    with _data_lock:
+        if _fingerprint[0] != dataset_version:
+            digest = hashlib.sha256(json.dumps(list(df.columns)).encode())
+            digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+            _fingerprint = (dataset_version, digest.hexdigest())
+        return df, filter_index, _fingerprint[1]
+
+def send_cached_export(handle, key, mimetype, extension):
+    """Send a cached export; answers If-None-Match with 304"""
+    response = send_file(handle, mimetype=mimetype, as_attachment=True,
+                         download_name=export_filename(extension), conditional=True, etag=key)
+    response.headers['X-Export-Cache'] = 'hit'
+    return response
+
+def not_modified(key):
+    """A 304 response if the client already holds export `key`, else None.
+
+    Exports are content-addressed, so this holds even after the file has
+    been evicted.
+    """
+    if key in request.if_none_match:
+        return Response(status=304, headers={'ETag': f'"{key}"'})
+    return None
+
+def iter_csv_to_cache(frame, positions, key):
+    """Yield the CSV export as bytes while writing it to the export cache.
+
+    The file is committed only once the last chunk has been sent; an
+    interrupted download leaves nothing behind.
+    """
+    partial = export_cache.partial_path(key, 'csv')
+    try:
+        with open(partial, 'wb') as output:
+            for text in iter_csv(frame, positions):
+                data = text.encode()
+                output.write(data)
+                yield data
+        export_cache.commit(partial, key, 'csv')
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+
+@app.server.route('/export/csv')
+def export_csv():
+    """Send the filtered dataset as CSV from the export cache, or stream it while caching it"""
+    try:
+        filters = filters_from_args(request.args)
+    except ValueError:
+        return {'error': 'year and month must be integers'}, 400
+    
+    frame, index, fingerprint = export_source()
+    key = export_cache.key(fingerprint, 'csv', filters)
+    cached = not_modified(key)
+    if cached is not None:
+        return cached
+    handle = export_cache.open(key, 'csv')
+    if handle is not None:
+        return send_cached_export(handle, key, 'text/csv', 'csv')
+    
+    positions = select_index_rows(index, filters)
+    note_rows(len(frame) if positions is None else len(positions))
+    return Response(
+        stream_with_context(iter_csv_to_cache(frame, positions, key)),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f"attachment; filename={export_filename('csv')}",
+                 'ETag': f'"{key}"', 'X-Export-Cache': 'miss'}
+    )
+
+# Excel allows 1,048,576 rows per sheet including the header row
+EXCEL_SHEET_ROWS = 1048575
+# Larger Excel exports are refused in favour of the CSV route
+EXCEL_EXPORT_MAX_ROWS = int(os.environ.get('EXCEL_EXPORT_MAX_ROWS', 2000000))
+
+# Rows between progress reports while an Excel file is written
+EXCEL_PROGRESS_ROWS = 5000
+
+def write_excel(frame, positions, output, sheet_rows=EXCEL_SHEET_ROWS, progress=None):
+    """Write the selected rows of `frame` as an .xlsx workbook to `output`.
+
+    Uses openpyxl's write-only mode, which streams rows to disk instead of
+    keeping a cell object per value, and continues on a new sheet whenever
+    `sheet_rows` is reached. `progress`, if given, is called with the rows
+    written so far every EXCEL_PROGRESS_ROWS rows. Returns the number of
+    data rows written.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    
+    workbook = Workbook(write_only=True)
+    header_font = Font(bold=True)
+    sheet = None
+    sheet_count = 0
+    sheet_filled = sheet_rows
+    rows_written = 0
+    
+    columns = with_display_columns(frame.head(0)).columns
+    for chunk in iter_row_chunks(frame, positions):
+        chunk = with_display_columns(chunk)
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        for row in chunk.itertuples(index=False, name=None):
+            if sheet_filled == sheet_rows:
+                sheet_count += 1
+                title = 'Filtered Data' if sheet_count == 1 else f'Filtered Data ({sheet_count})'
+                sheet = workbook.create_sheet(title)
+                header = []
+                for column in columns:
+                    cell = WriteOnlyCell(sheet, value=column)
+                    cell.font = header_font
+                    header.append(cell)
+                sheet.append(header)
+                sheet_filled = 0
+            sheet.append(row)
+            sheet_filled += 1
+            rows_written += 1
+            if progress is not None and rows_written % EXCEL_PROGRESS_ROWS == 0:
+                progress(rows_written)
+    
+    if sheet is None:
+        sheet = workbook.create_sheet('Filtered Data')
+        sheet.append(list(columns))
+    
+    workbook.save(output)
+    return rows_written
+
+# zlib level for gzip CSV exports; 6 compresses about as well as 9 in half the time
+EXPORT_GZIP_LEVEL = 6
+
+def write_csv_gzip(frame, positions, output, progress=None):
+    """Write the selected rows of `frame` as gzip-compressed CSV; returns the rows written"""
+    # mtime=0 keeps the bytes identical for identical data
+    with gzip.GzipFile(fileobj=output, mode='wb', compresslevel=EXPORT_GZIP_LEVEL, mtime=0) as stream:
+        return write_csv(frame, positions, stream, progress)
+
+def write_csv_zstd(frame, positions, output, progress=None):
+    """Write the selected rows of `frame` as zstd-compressed CSV; returns the rows written"""
+    import pyarrow as pa
+    
+    with pa.CompressedOutputStream(pa.PythonFile(output, mode='w'), 'zstd') as stream:
+        return write_csv(frame, positions, stream, progress)
+
+def arrow_schema(frame):
+    """Arrow schema for writing chunks of `frame`, whatever rows are selected.
+
+    Inferred from the frame's first row rather than an empty head: without
+    the compact schema the dimension columns are plain object columns,
+    which pyarrow types as null when it sees no values. A column whose
+    first value is missing takes the type of its first present one.
+    """
+    import pyarrow as pa
+    
+    schema = pa.Schema.from_pandas(frame.iloc[:1], preserve_index=False)
+    for i, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            values = frame[field.name].dropna()
+            if len(values):
+                sample = pa.Schema.from_pandas(values.iloc[:1].to_frame(), preserve_index=False)
+                schema = schema.set(i, field.with_type(sample.field(field.name).type))
+    return schema
+
+def write_parquet(frame, positions, output, progress=None):
+    """Write the selected rows of `frame` as zstd-compressed Parquet, one row group per chunk.
+
+    The typed columns are written as they are, categoricals as dictionary
+    columns, so readers get the dataset's dtypes back without parsing.
+    Returns the number of rows written.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    schema = arrow_schema(frame)
+    rows_written = 0
+    with pq.ParquetWriter(output, schema, compression='zstd') as writer:
+        for chunk in iter_row_chunks(frame, positions):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            rows_written += len(chunk)
+            if progress is not None:
+                progress(rows_written)
+    return rows_written
+
+def write_arrow(frame, positions, output, progress=None):
+    """Write the selected rows of `frame` as an Arrow IPC file (Feather v2) with zstd-compressed buffers.
+
+    Like write_parquet, the typed columns are written as they are.
+    Returns the number of rows written.
+    """
+    import pyarrow as pa
+    
+    schema = arrow_schema(frame)
+    options = pa.ipc.IpcWriteOptions(compression='zstd')
+    rows_written = 0
+    with pa.ipc.new_file(pa.PythonFile(output, mode='w'), schema, options=options) as writer:
+        for chunk in iter_row_chunks(frame, positions):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            rows_written += len(chunk)
+            if progress is not None:
+                progress(rows_written)
+    return rows_written
+
+# Export formats by file extension: (mimetype, writer). Every writer takes
+# (frame, positions, output, progress=None) and returns the rows written.
+# CSV and Excel carry the display columns; Parquet and Arrow the typed ones.
+EXPORT_FORMATS = {
+    'csv': ('text/csv', write_csv),
+    'csv.gz': ('application/gzip', write_csv_gzip),
+    'csv.zst': ('application/zstd', write_csv_zstd),
+    'parquet': ('application/vnd.apache.parquet', write_parquet),
+    'arrow': ('application/vnd.apache.arrow.file', write_arrow),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', write_excel),
+}
+
+@app.server.route('/export/<export_format>')
+def export_file(export_format):
+    """Send the filtered dataset in `export_format`, writing it into the export cache if needed.
+
+    Plain CSV has its own streaming route; this one serves the compressed,
+    columnar and Excel formats.
+    """
+    if export_format not in EXPORT_FORMATS:
+        return {'error': f"format must be one of {', '.join(EXPORT_FORMATS)}"}, 404
+    try:
+        filters = filters_from_args(request.args)
+    except ValueError:
+        return {'error': 'year and month must be integers'}, 400
+    
+    mimetype, writer = EXPORT_FORMATS[export_format]
+    frame, index, fingerprint = export_source()
+    key = export_cache.key(fingerprint, export_format, filters)
+    cached = not_modified(key)
+    if cached is not None:
+        return cached
+    handle = export_cache.open(key, export_format)
+    if handle is not None:
+        return send_cached_export(handle, key, mimetype, export_format)
+    
+    positions = select_index_rows(index, filters)
+    n_rows = len(frame) if positions is None else len(positions)
+    note_rows(n_rows)
+    if export_format == 'xlsx' and n_rows > EXCEL_EXPORT_MAX_ROWS:
+        return {'error': f'{n_rows:,} rows exceeds the Excel export limit of '
+                         f'{EXCEL_EXPORT_MAX_ROWS:,}; use the CSV export instead'}, 413
+    
+    started = time.perf_counter()
+    partial = export_cache.partial_path(key, export_format)
+    try:
+        with open(partial, 'wb') as output:
+            writer(frame, positions, output)
+        # Opened before the commit so eviction cannot remove it before it is sent
+        handle = open(partial, 'rb')
+        try:
+            export_cache.commit(partial, key, export_format)
+        except Exception:
+            handle.close()
+            raise
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+    elapsed = time.perf_counter() - started
+    size = os.fstat(handle.fileno()).st_size
+    logger.info("%s export: %d rows, %d bytes in %.2fs", export_format, n_rows, size, elapsed)
+    
+    response = send_file(
+        handle,
+        mimetype=mimetype,
+        as_attachment=True,
+        download_name=export_filename(export_format),
+        etag=key
+    )
+    response.headers['X-Export-Cache'] = 'miss'
+    response.headers['X-Export-Rows'] = str(n_rows)
+    response.headers['X-Export-Bytes'] = str(size)
+    response.headers['X-Export-Seconds'] = f"{elapsed:.3f}"
+    return response
+
+# Background export jobs: a thread pool writes each file into the spool
+# directory with the job's state next to it as JSON, so any worker can report
+# a job's progress and serve its file. Spooled jobs expire after the TTL.
+EXPORT_SPOOL_DIR = os.environ.get('EXPORT_SPOOL_DIR', os.path.join(DATA_CACHE_DIR, 'exports'))
+EXPORT_SPOOL_TTL_SECONDS = float(os.environ.get('EXPORT_SPOOL_TTL_SECONDS', 3600))
+EXPORT_JOB_WORKERS = int(os.environ.get('EXPORT_JOB_WORKERS', 2))
+# Seconds between writes of a running job's progress
+EXPORT_PROGRESS_SECONDS = 0.5
+
+_export_executor = None
+_export_executor_lock = threading.Lock()
+
+def export_executor():
+    """The process's export thread pool, created on first use so none is started before gunicorn forks"""
+    global _export_executor
+    with _export_executor_lock:
+        if _export_executor is None:
+            _export_executor = ThreadPoolExecutor(max_workers=EXPORT_JOB_WORKERS,
+                                                  thread_name_prefix='export-job')
+    return _export_executor
+
+def job_path(job_id, extension='json'):
+    return os.path.join(EXPORT_SPOOL_DIR, f"{job_id}.{extension}")
+
+def write_job(job):
+    """Save a job's state, replacing the previous one atomically"""
+    partial = os.path.join(EXPORT_SPOOL_DIR, f".{job['id']}.json.tmp")
+    with open(partial, 'w') as handle:
+        json.dump(job, handle)
+    os.replace(partial, job_path(job['id']))
+
+def read_job(job_id):
+    """A job's saved state, or None for an unknown or expired job"""
+    if not re.fullmatch(r'[0-9a-f]{32}', job_id):
+        return None
+    try:
+        with open(job_path(job_id)) as handle:
+            return json.load(handle)
+    except (FileNotFoundError, ValueError):
+        return None
+
+def clean_spool(now=None):
+    """Remove spooled files not modified within EXPORT_SPOOL_TTL_SECONDS; returns how many were removed"""
+    cutoff = (now or time.time()) - EXPORT_SPOOL_TTL_SECONDS
+    removed = 0
+    if not os.path.isdir(EXPORT_SPOOL_DIR):
+        return removed
+    for entry in os.scandir(EXPORT_SPOOL_DIR):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except FileNotFoundError:
+            pass  # removed by another worker
+    return removed
+
+def submit_export_job(filters, export_format):
+    """Queue an export of the rows matching `filters`; returns the job's initial state.
+
+    The rows are selected now, so the file reflects the dataset at submission
+    even if it is reloaded while the job waits. Raises ValueError for an
+    Excel export over EXCEL_EXPORT_MAX_ROWS.
+    """
+    frame, index, fingerprint = export_source()
+    positions = select_index_rows(index, filters)
+    n_rows = len(frame) if positions is None else len(positions)
+    if export_format == 'xlsx' and n_rows > EXCEL_EXPORT_MAX_ROWS:
+        raise ValueError(f'{n_rows:,} rows exceeds the Excel export limit of '
+                         f'{EXCEL_EXPORT_MAX_ROWS:,}; use the CSV export instead')
+    
+    os.makedirs(EXPORT_SPOOL_DIR, exist_ok=True)
+    clean_spool()
+    job = {
+        'id': uuid.uuid4().hex,
+        'format': export_format,
+        'filename': export_filename(export_format),
+        'status': 'queued',
+        'rows': n_rows,
+        'rows_written': 0,
+        'bytes': None,
+        'error': None,
+        'dataset_version': dataset_version,
+        'cache_key': export_cache.key(fingerprint, export_format, filters),
+        'created': time.time(),
+        'finished': None,
+    }
+    write_job(job)
+    export_executor().submit(run_export_job, dict(job), frame, positions)
+    return job
+
+def run_export_job(job, frame, positions):
+    """Write a job's file into the spool directory, saving its progress as it goes.
+
+    A file already in the export cache is copied instead, and a newly
+    written one is added to the cache.
+    """
+    job['status'] = 'running'
+    write_job(job)
+    last_saved = time.monotonic()
+    
+    def progress(rows_written):
+        nonlocal last_saved
+        job['rows_written'] = rows_written
+        if time.monotonic() - last_saved >= EXPORT_PROGRESS_SECONDS:
+            write_job(job)
+            last_saved = time.monotonic()
+    
+    started = time.perf_counter()
+    partial = os.path.join(EXPORT_SPOOL_DIR, f".{job['id']}.{job['format']}.tmp")
+    try:
+        with open(partial, 'wb') as output:
+            cached = export_cache.open(job['cache_key'], job['format'])
+            if cached is not None:
+                with cached:
+                    shutil.copyfileobj(cached, output)
+                job['rows_written'] = job['rows']
+            else:
+                writer = EXPORT_FORMATS[job['format']][1]
+                job['rows_written'] = writer(frame, positions, output, progress=progress)
+        os.replace(partial, job_path(job['id'], job['format']))
+        if cached is None:
+            export_cache.store(job_path(job['id'], job['format']), job['cache_key'], job['format'])
+        job['status'] = 'done'
+        job['bytes'] = os.path.getsize(job_path(job['id'], job['format']))
+        logger.info("Export job %s: %d rows, %d bytes of %s in %.2fs", job['id'], job['rows'],
+                    job['bytes'], job['format'], time.perf_counter() - started)
+    except Exception as e:
+        logger.exception("Export job %s failed", job['id'])
+        if os.path.exists(partial):
+            os.remove(partial)
+        job['status'] = 'failed'
+        job['error'] = str(e)
+    job['finished'] = time.time()
+    write_job(job)
+
+def export_job_status(job):
+    """A job's state as answered by the job routes, with its progress and URLs"""
+    status = dict(job, progress=job['rows_written'] / job['rows'] if job['rows'] else 1.0,
+                  status_url=app.get_relative_path(f"/export/jobs/{job['id']}"))
+    if job['status'] == 'done':
+        status['file_url'] = app.get_relative_path(f"/export/jobs/{job['id']}/file")
+    return status
+
+@app.server.route('/export/jobs', methods=['POST'])
+def create_export_job():
+    """Start a background export of the filtered dataset; poll the returned status_url"""
+    export_format = request.args.get('format', 'xlsx')
+    if export_format not in EXPORT_FORMATS:
+        return {'error': f"format must be one of {', '.join(EXPORT_FORMATS)}"}, 400
+    try:
+        filters = filters_from_args(request.args)
+    except ValueError:
+        return {'error': 'year and month must be integers'}, 400
+    
+    try:
+        job = submit_export_job(filters, export_format)
+    except ValueError as e:
+        return {'error': str(e)}, 413
+    note_rows(job['rows'])
+    return export_job_status(job), 202
+
+@app.server.route('/export/jobs/<job_id>')
+def export_job(job_id):
+    """Report an export job's progress"""
+    job = read_job(job_id)
+    if job is None:
+        return {'error': 'unknown or expired export job'}, 404
+    return export_job_status(job), 200
+
+@app.server.route('/export/jobs/<job_id>/file')
+def export_job_file(job_id):
+    """Send a finished export job's file from the spool directory"""
+    job = read_job(job_id)
+    if job is None or job['status'] != 'done':
+        return {'error': 'export file is not available'}, 404
+    return send_file(job_path(job_id, job['format']), mimetype=EXPORT_FORMATS[job['format']][0],
+                     as_attachment=True, download_name=job['filename'])
+
+# Bearer token for the admin routes; they answer 404 when it is not set
+ADMIN_TOKEN = os.environ.get('TRACTOR_ADMIN_TOKEN')
+
+@app.server.route('/admin/append', methods=['POST'])
+def admin_append():
+    """Append a monthly extract: a CSV in the source sheet layout plus Month and Year columns.
+
+    Accepts the CSV as the request body or as a 'file' upload. The extract is
+    validated, stored in INGEST_DIR and applied here straight away; other
+    workers pick it up on their next poll. An extract with rows for a month
+    the dataset already has is refused with 409.
+    """
+    if not ADMIN_TOKEN:
+        return {'error': 'not found'}, 404
+    if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {ADMIN_TOKEN}'):
+        return {'error': 'unauthorized'}, 401
+    
+    upload = request.files.get('file')
+    body = upload.read() if upload else request.get_data()
+    if not body:
+        return {'error': 'no CSV supplied'}, 400
+    digest = hashlib.sha256(body).hexdigest()[:16]
+    os.makedirs(INGEST_DIR, exist_ok=True)
+    
+    name = f"{datetime.now():%Y%m%d-%H%M%S}-{digest}.csv"
+    partial = os.path.join(INGEST_DIR, f".{name}.tmp")
+    with open(partial, 'wb') as handle:
+        handle.write(body)
+    try:
+        rows = load_tractor_csv(partial, cache_dir=None)
+        if 'Month' not in rows.columns:
+            raise ValueError("Month and Year columns are required")
+    except (KeyError, ValueError) as e:
+        os.remove(partial)
+        return {'error': f'invalid extract: {e}'}, 400
+    
+    with _data_lock:
+        # Apply the extracts other workers stored first, so their months count as present
+        sync_ingested()
+        _, index, _ = dataset_snapshot()
+        present = [f"{year}-{month:02d}"
+                   for year, month in rows[['Year', 'Month']].drop_duplicates().itertuples(index=False)
+                   if len(index.select(*['All'] * 6, year, month))]
+        if present:
+            os.remove(partial)
+            return {'error': f"the dataset already has rows for {', '.join(sorted(present))}"}, 409
+        os.replace(partial, os.path.join(INGEST_DIR, name))
+        added = sync_ingested()
+    return {'file': name, 'rows_added': added, 'rows': len(df), 'dataset_version': dataset_version}, 200
+
+# Cold start budget: a fresh process importing the app and answering its first /health
+STARTUP_BUDGET_SECONDS = float(os.environ.get('STARTUP_BUDGET_SECONDS', 3.0))
+
+_STARTUP_PROBE = """
+import json, time
+started = time.time()
+import comprehensive_dashboard as dashboard
+imported = time.time()
+loaded_at_import = dashboard.dataset_version > 0
+status = dashboard.server.test_client().get('/health').status_code
+healthy = time.time()
+dashboard.warm_up()
+warm = time.time()
+print(json.dumps({'started': started, 'imported': imported, 'healthy': healthy, 'warm': warm,
+                  'status': status, 'loaded_at_import': loaded_at_import}))
+"""
+
+def profile_startup(top=15):
+    """Cold-start a fresh interpreter and report where the time goes.
+
+    Returns seconds from process launch to a completed import, to the first
+    /health response and to a warmed-up dataset, the /health status, whether
+    importing loaded any data, and the `top` slowest imports by cumulative
+    time as reported by `python -X importtime`.
+    """
+    launched = time.time()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _STARTUP_PROBE],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)))
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    
+    imports = []
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if line.startswith('import time:') and fields[1].strip().isdigit():
+            imports.append((int(fields[1]) / 1e6, fields[2].strip()))
+    imports.sort(reverse=True)
+    
+    return {
+        'import_seconds': probe['imported'] - launched,
+        'first_health_seconds': probe['healthy'] - launched,
+        'warm_seconds': probe['warm'] - launched,
+        'health_status': probe['status'],
+        'loaded_at_import': probe['loaded_at_import'],
+        'budget_seconds': STARTUP_BUDGET_SECONDS,
+        'slowest_imports': imports[:top],
+    }
 
 if __name__ == '__main__':
+    if '--profile-startup' in sys.argv:
+        report = profile_startup()
+        print(f"Import:        {report['import_seconds']:.2f}s")
+        print(f"First /health: {report['first_health_seconds']:.2f}s "
+              f"(HTTP {report['health_status']}, budget {report['budget_seconds']:.2f}s)")
+        print(f"Warmed up:     {report['warm_seconds']:.2f}s")
+        print("Slowest imports (cumulative):")
+        for seconds, module in report['slowest_imports']:
+            print(f"  {seconds:7.3f}s  {module}")
+        sys.exit(0 if report['first_health_seconds'] <= STARTUP_BUDGET_SECONDS else 1)
+    if PREWARM:
+        warm_up()
     app.run(debug=False, host='0.0.0.0', port=int(os.environ.get('PORT', 8055)))
@@ -0,0 +1,33 @@
+"""Gunicorn settings for the Japan Agricultural Tractor Tracker dashboard.
+
+The app is imported once in the master (preload_app). Importing it does not
+load any data; when_ready() warms it up in the master instead, so the
+dataset, its filter index and aggregates and the default view's figures are
+built a single time and shared with every worker through fork copy-on-write.
+Set TRACTOR_PREWARM=0 to skip this and let each worker load on first request.
+"""
+
+import gc
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8051)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+
+# Build the dataset in the master and fork workers from it
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master after the socket is bound and before any worker is forked
+    import comprehensive_dashboard
+    if comprehensive_dashboard.PREWARM:
+        comprehensive_dashboard.warm_up()
+
+
+def pre_fork(server, worker):
+    # Move everything allocated so far into the permanent GC generation.
+    # Otherwise the collector's bookkeeping writes into every object header
+    # in each worker and gradually copies the shared pages.
+    gc.freeze()
@@ -8,6 +8,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
 import numpy as np
+import io
 
 def test_comprehensive_data_creation():
     """Test creating comprehensive dummy data"""
@@ -41,6 +42,92 @@ def test_comprehensive_data_creation():
         print(f"✗ Error creating comprehensive data: {e}")
         return False
 
+def test_seeded_data_generation():
+    """Test that seeded data generation is reproducible and configurable"""
+    print("\nTesting seeded data generation...")
+    
+    try:
+        from comprehensive_dashboard import create_comprehensive_dummy_data
+        
+        first = create_comprehensive_dummy_data(np.random.default_rng(7))
+        second = create_comprehensive_dummy_data(np.random.default_rng(7))
+        assert first.equals(second), "Same seed should produce identical data"
+        
+        df = create_comprehensive_dummy_data(np.random.default_rng(7), start='2023-07', end='2024-06', n_base_rows=60)
+        assert len(df) == 12 * 60, "Rows should equal months x series"
+        assert df['Date'].min() == pd.Timestamp('2023-07-01'), "Span should start at the requested month"
+        assert df['Date'].max() == pd.Timestamp('2024-06-01'), "Span should end at the requested month"
+        assert df['Model Name'].nunique() == 60, "Repeated series should get distinct model names"
+        assert df['Sales_Min'].min() > 0, "Sales should be positive"
+        
+        print(f"✓ Generated {len(df):,} reproducible rows")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing seeded data generation: {e}")
+        return False
+
+def test_csv_data_loader():
+    """Test loading last_sheet_clean.csv and its cached snapshot"""
+    print("\nTesting CSV data loader...")
+    
+    try:
+        from comprehensive_dashboard import load_tractor_csv, create_comprehensive_dummy_data
+        import os
+        import tempfile
+        
+        cache_dir = tempfile.mkdtemp()
+        catalogue = load_tractor_csv('last_sheet_clean.csv', cache_dir=cache_dir)
+        
+        assert len(catalogue) == 26, "Blank and note rows should be dropped"
+        assert catalogue['Manufacturer Name'].notna().all(), "Blank manufacturer cells should be filled"
+        assert catalogue['Manufacturer Name'].nunique() == 7, "All manufacturers should be present"
+        assert 'Dollar Value of Tractor (ASP Range in US$)' not in catalogue.columns, "Price text should be parsed"
+        gm = catalogue[catalogue['Brand Name'] == 'GM'].iloc[0]
+        assert (gm['Sales_Min'], gm['Sales_Max']) == (1200, 1800), "En-dash sales ranges should be parsed"
+        assert len(os.listdir(cache_dir)) == 1, "A snapshot should be written"
+        
+        cached = load_tractor_csv('last_sheet_clean.csv', cache_dir=cache_dir)
+        assert cached.equals(catalogue), "Snapshot should round-trip the parsed data"
+        
+        df = create_comprehensive_dummy_data(np.random.default_rng(1), catalogue=catalogue)
+        assert len(df) == 24 * 26, "Catalogue should expand to monthly series"
+        
+        print("✓ CSV data loader test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing CSV data loader: {e}")
+        return False
+
+def test_compact_schema():
+    """Test the compact dtype schema"""
+    print("\nTesting compact schema...")
+    
+    try:
+        from comprehensive_dashboard import create_comprehensive_dummy_data, compact_schema
+        
+        df = create_comprehensive_dummy_data(np.random.default_rng(3))
+        compact = compact_schema(df)
+        
+        assert compact['Manufacturer Name'].dtype == 'category', "Dimensions should be categorical"
+        assert compact['Month'].dtype == np.int8, "Month should be int8"
+        assert compact['Year'].dtype == np.int16, "Year should be int16"
+        assert compact['Sales_Min'].dtype == np.int32, "Sales should be int32"
+        assert compact['Price_Min'].dtype == np.float32, "Whole-dollar prices should be float32"
+        assert compact['HP_Min'].dtype == np.float64, "Fractional HP values should keep float64"
+        assert (compact['Price_Max'].to_numpy(dtype=float) == df['Price_Max'].to_numpy()).all(), "Values should be unchanged"
+        
+        before = df.memory_usage(deep=True).sum()
+        after = compact.memory_usage(deep=True).sum()
+        assert after < before, "Compact schema should use less memory"
+        print(f"✓ Memory {before / 1e3:,.0f} KB -> {after / 1e3:,.0f} KB")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing compact schema: {e}")
+        return False
+
 def test_filter_functionality():
     """Test filter functionality"""
     print("\nTesting filter functionality...")
@@ -51,25 +138,26 @@ def test_filter_functionality():
         df = create_comprehensive_dummy_data()
         
         # Test manufacturer filter
-        filtered_df = apply_filters(df, 'Kubota Corporation', 'All', 'All', 'All', 'All', 'All', 'All', 'All', 'All', 'All', None, None)
+        filtered_df = apply_filters(df, 'Kubota Corporation', 'All', 'All', 'All', 'All', 'All', 'All', 'All')
         assert len(filtered_df) > 0, "Manufacturer filter should return data"
         assert all(filtered_df['Manufacturer Name'] == 'Kubota Corporation'), "All records should be Kubota"
         
         # Test year filter
-        filtered_df = apply_filters(df, 'All', 'All', 'All', 'All', 'All', 'All', 'All', 'All', 2023, 'All', None, None)
+        filtered_df = apply_filters(df, 'All', 'All', 'All', 'All', 'All', 'All', 2024, 'All')
         assert len(filtered_df) > 0, "Year filter should return data"
-        assert all(filtered_df['Year'] == 2023), "All records should be from 2023"
+        assert all(filtered_df['Year'] == 2024), "All records should be from 2024"
         
         # Test month filter
-        filtered_df = apply_filters(df, 'All', 'All', 'All', 'All', 'All', 'All', 'All', 'All', 'All', 6, None, None)
+        filtered_df = apply_filters(df, 'All', 'All', 'All', 'All', 'All', 'All', 'All', 6)
         assert len(filtered_df) > 0, "Month filter should return data"
         assert all(filtered_df['Month'] == 6), "All records should be from June"
         
-        # Test price range filter
-        filtered_df = apply_filters(df, 'All', 'All', 'All', 'All', 'All', 'All', 'All', 'All', 'All', 'All', [20000, 50000], None)
-        assert len(filtered_df) > 0, "Price range filter should return data"
-        assert all(filtered_df['Price_Min'] >= 20000), "All prices should be >= 20000"
-        assert all(filtered_df['Price_Max'] <= 50000), "All prices should be <= 50000"
+        # Test combined filters
+        filtered_df = apply_filters(df, 'Kubota Corporation', 'All', 'All', 'All', 'All', 'USA', 2025, 6)
+        assert len(filtered_df) > 0, "Combined filters should return data"
+        assert all(filtered_df['Manufacturer Name'] == 'Kubota Corporation'), "All records should be Kubota"
+        assert all(filtered_df['End Destination Country'] == 'USA'), "All records should ship to the USA"
+        assert all((filtered_df['Year'] == 2025) & (filtered_df['Month'] == 6)), "All records should be from June 2025"
         
         print("✓ All filter tests passed")
         return True
@@ -78,6 +166,187 @@ def test_filter_functionality():
         print(f"✗ Error testing filters: {e}")
         return False
 
+def test_filter_index():
+    """Test that the filter index matches plain boolean masks"""
+    print("\nTesting filter index...")
+    
+    try:
+        from comprehensive_dashboard import create_comprehensive_dummy_data, apply_filters, FILTER_COLUMNS
+        
+        df = create_comprehensive_dummy_data()
+        
+        combinations = [
+            ('Kubota Corporation', 'All', 'All', 'All', 'All', 'All', 2025, 'All'),
+            ('All', 'All', 'All', 'All', 'Japan', 'USA', 'All', 3),
+            ('John Deere', '6M Series', 'All', 'All', 'All', 'All', 2024, 12),
+            ('AGCO', 'BX Series', 'All', 'All', 'All', 'All', 'All', 'All'),
+        ]
+        for values in combinations:
+            expected = df
+            for column, value in zip(FILTER_COLUMNS, values):
+                if value != 'All':
+                    expected = expected[expected[column] == value]
+            filtered_df = apply_filters(df, *values)
+            assert filtered_df.index.equals(expected.index), f"Index mismatch for {values}"
+        
+        assert len(apply_filters(df, *['All'] * 8)) == len(df), "No filters should return every row"
+        
+        # Filtering a caller's frame must not load the dashboard dataset
+        import subprocess, sys
+        probe = ("import comprehensive_dashboard as d; "
+                 "frame = d.add_derived_columns(d.create_comprehensive_dummy_data()); "
+                 "d.apply_filters(frame, 'Kubota Corporation', *['All'] * 7); "
+                 "assert d.dataset_version == 0, 'dataset was loaded'")
+        result = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr.strip().splitlines()[-1]
+        
+        print("✓ Filter index tests passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing filter index: {e}")
+        return False
+
+def test_aggregate_cube():
+    """Test that cube aggregates match raw-row aggregates"""
+    print("\nTesting aggregate cube...")
+    
+    try:
+        from comprehensive_dashboard import (df, apply_filters, get_cube_cells, cube_mean, CubeRollups,
+                                             FilterIndex, create_comprehensive_dummy_data, add_derived_columns,
+                                             CARD_DIMENSIONS, CHART_DIMENSIONS)
+        
+        # The unfiltered views read roll-ups far smaller than the table
+        large = add_derived_columns(create_comprehensive_dummy_data(np.random.default_rng(3), n_base_rows=400))
+        large_rollups = CubeRollups(large, FilterIndex(large))
+        for dimensions in (CARD_DIMENSIONS, CHART_DIMENSIONS):
+            cube = large_rollups.cube(dimensions)
+            assert len(cube) * 20 <= len(large), f"{dimensions} cube has {len(cube)} cells for {len(large)} rows"
+            assert cube['Rows'].sum() == len(large)
+        
+        # Models by month come close to one cell per row: answered from the selected rows, never cached
+        month = ('All',) * 7 + (int(large['Month'].iloc[0]),)
+        built = large_rollups.stats()['entries']
+        cells = large_rollups.cells(month, CARD_DIMENSIONS)
+        assert large_rollups.stats()['entries'] == built, "A near row-count grain should not be cached"
+        assert cells['Rows'].sum() == (large['Month'] == month[-1]).sum()
+        assert len(cells) == large.loc[large['Month'] == month[-1], 'Model Name'].nunique()
+        
+        # The cubes kept stay within the byte budget, the least recently used going first
+        small = CubeRollups(large, FilterIndex(large), max_bytes=large_rollups.stats()['bytes'])
+        small.cube(CARD_DIMENSIONS)
+        small.cube(CHART_DIMENSIONS)
+        small.cube(('Manufacturer Name', 'Year'))
+        stats = small.stats()
+        assert stats['bytes'] <= stats['max_bytes'] and stats['evictions'] >= 1, stats
+        assert ('Manufacturer Name', 'Year') in small._cubes
+        
+        combinations = [
+            ('All', 'All', 'All', 'All', 'All', 'All', 'All', 'All'),
+            ('Yanmar Holdings', 'All', 'All', 'All', 'All', 'All', 2025, 'All'),
+            ('All', 'All', 'All', 'All', 'Japan', 'All', 'All', 9),
+        ]
+        for values in combinations:
+            filtered_df = apply_filters(df, *values)
+            cells = get_cube_cells(*values, CARD_DIMENSIONS)
+            assert cells['Rows'].sum() == len(filtered_df), f"Row count mismatch for {values}"
+            assert cells['Model Name'].nunique() == filtered_df['Model Name'].nunique(), f"Model count mismatch for {values}"
+            assert abs(cube_mean(cells, 'Price_Min') - filtered_df['Price_Min'].mean()) < 1e-6 * filtered_df['Price_Min'].mean(), \
+                f"Mean price mismatch for {values}"
+            assert cells['Sales_Max_sum'].sum() == filtered_df['Sales_Max'].sum(), f"Sales sum mismatch for {values}"
+        
+        print("✓ Aggregate cube test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing aggregate cube: {e}")
+        return False
+
+def test_card_cells():
+    """Test the encoded cube cells shipped to the clientside summary cards"""
+    print("\nTesting summary card cells...")
+    
+    try:
+        from comprehensive_dashboard import df, rollups, build_card_cells, FILTER_COLUMNS
+        
+        cells = build_card_cells(rollups.cube(FILTER_COLUMNS))
+        n_cells = len(cells['measures']['Rows'])
+        assert cells['columns'] == FILTER_COLUMNS
+        assert all(len(cells['codes'][column]) == n_cells for column in FILTER_COLUMNS)
+        assert sum(cells['measures']['Rows']) == len(df)
+        
+        # Totals for one manufacturer and year, decoded the way the browser does
+        manufacturer, year = str(df['Manufacturer Name'].iloc[0]), 2025
+        m_code = cells['values']['Manufacturer Name'].index(manufacturer)
+        y_code = cells['values']['Year'].index(str(year))
+        matched = [i for i in range(n_cells)
+                   if cells['codes']['Manufacturer Name'][i] == m_code and cells['codes']['Year'][i] == y_code]
+        subset = df[(df['Manufacturer Name'] == manufacturer) & (df['Year'] == year)]
+        assert sum(cells['measures']['Rows'][i] for i in matched) == len(subset)
+        assert np.isclose(sum(cells['measures']['Sales_Min_sum'][i] for i in matched), subset['Sales_Min'].sum())
+        
+        # The cells are served once per dataset from a versioned URL, not embedded in the layout
+        import gzip, json
+        import comprehensive_dashboard as dashboard
+        encoded = dashboard.encode_card_cells(df)
+        assert json.loads(gzip.decompress(encoded[2])) == json.loads(encoded[1]) == cells
+        previous, dashboard.card_cells = dashboard.card_cells, encoded
+        try:
+            client = dashboard.server.test_client()
+            urls = dashboard.summary_card_urls()
+            response = client.get(urls['cells'], headers={'Accept-Encoding': 'gzip'})
+            assert response.status_code == 200 and response.headers['Content-Encoding'] == 'gzip'
+            assert 'immutable' in response.headers['Cache-Control']
+            assert client.get(urls['cells'], headers={'If-None-Match': response.headers['ETag']}).status_code == 304
+        finally:
+            dashboard.card_cells = previous
+        
+        # Too many cells: none are shipped and the browser asks for each state's values
+        limit, dashboard.SUMMARY_CARD_CELLS_MAX = dashboard.SUMMARY_CARD_CELLS_MAX, 10
+        try:
+            assert dashboard.encode_card_cells(df) is None
+        finally:
+            dashboard.SUMMARY_CARD_CELLS_MAX = limit
+        filters = (manufacturer,) + ('All',) * 5 + (year, 'All')
+        response = client.get(urls['values'] + '?' + dashboard.export_query(*filters))
+        assert response.json['values'] == dashboard.summary_card_values(*filters)
+        
+        print("✓ Summary card cells test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing summary card cells: {e}")
+        return False
+
+def test_option_hierarchy():
+    """Test the cascading dropdown options served from the option hierarchy"""
+    print("\nTesting option hierarchy...")
+    
+    try:
+        from comprehensive_dashboard import (df, update_brand_dropdown, update_model_dropdown,
+                                             build_option_hierarchy, rollups, HIERARCHY_DIMENSIONS)
+        
+        manufacturer = df['Manufacturer Name'].iloc[0]
+        brands = sorted(df[df['Manufacturer Name'] == manufacturer]['Brand Name'].unique())
+        options = update_brand_dropdown(manufacturer)
+        assert [o['value'] for o in options] == ['All'] + brands
+        
+        brand = brands[0]
+        subset = df[(df['Manufacturer Name'] == manufacturer) & (df['Brand Name'] == brand)]
+        options = update_model_dropdown(manufacturer, brand)
+        assert [o['value'] for o in options] == ['All'] + sorted(subset['Model Name'].unique())
+        assert len(update_model_dropdown('All', 'All')) == df['Model Name'].nunique() + 1
+        assert update_model_dropdown('Unknown', 'All') == [{'label': 'All Models', 'value': 'All'}]
+        
+        assert build_option_hierarchy(df) == build_option_hierarchy(rollups.cube(HIERARCHY_DIMENSIONS)), "Cube and rows should agree"
+        
+        print("✓ Option hierarchy test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing option hierarchy: {e}")
+        return False
+
 def test_chart_creation():
     """Test creating charts with the data"""
     print("\nTesting chart creation...")
@@ -152,6 +421,128 @@ def test_chart_creation():
         print(f"✗ Error creating charts: {e}")
         return False
 
+def test_monthly_sales_chart():
+    """Test month completion in the monthly sales chart"""
+    print("\nTesting monthly sales chart...")
+    
+    try:
+        from comprehensive_dashboard import update_charts, MONTH_NAMES
+        
+        charts = update_charts('John Deere', 'All', 'All', 'All', 'All', 'All', 2024, 'All')
+        fig_time = go.Figure(charts.children[0].children.figure)
+        assert len(fig_time.data) == 1, "Only the selected manufacturer should be plotted"
+        assert list(fig_time.data[0].x) == MONTH_NAMES, "All twelve months should be shown in order"
+        
+        charts = update_charts('All', 'All', 'All', 'All', 'All', 'All', 'All', 5)
+        fig_time = go.Figure(charts.children[0].children.figure)
+        assert fig_time.layout.title.text == "Sales by Manufacturer - May", "Single month should use a bar chart"
+        
+        print("✓ Monthly sales chart test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing monthly sales chart: {e}")
+        return False
+
+def test_scatter_downsampling():
+    """Test aggregation and extreme-preserving downsampling of the scatter points"""
+    print("\nTesting scatter downsampling...")
+    
+    try:
+        from comprehensive_dashboard import (create_comprehensive_dummy_data, scatter_points,
+                                             SCATTER_EXTREME_COLUMNS)
+        
+        df = create_comprehensive_dummy_data(rng=np.random.default_rng(3))
+        points, aggregated = scatter_points(df, max_points=len(df))
+        assert not aggregated and len(points) == len(df), "Small selections should plot every row"
+        
+        points, aggregated = scatter_points(df, max_points=50)
+        assert aggregated and len(points) <= 50, "Large selections should be reduced"
+        assert 'Rows' in points.columns
+        for column in SCATTER_EXTREME_COLUMNS:
+            monthly = df.groupby(['Model Name', 'Year', 'Month'], observed=True)
+            extreme = monthly[column].sum() if column == 'Sales_Min' else monthly[column].mean()
+            assert np.isclose(points[column].max(), extreme.max()), f"Maximum {column} should be kept"
+            assert np.isclose(points[column].min(), extreme.min()), f"Minimum {column} should be kept"
+        
+        print("✓ Scatter downsampling test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing scatter downsampling: {e}")
+        return False
+
+def test_figure_cache():
+    """Test the figure cache counters, eviction and invalidation on reload"""
+    print("\nTesting figure cache...")
+    
+    try:
+        import comprehensive_dashboard as dashboard
+        from comprehensive_dashboard import FigureCache, update_charts
+        
+        cache = FigureCache(max_bytes=10)
+        cache.put('a', '12345')
+        cache.put('b', '12345')
+        assert cache.get('a') == '12345' and cache.get('missing') is None
+        cache.put('c', '12345')
+        stats = cache.stats()
+        assert cache.get('b') is None, "Least recently used entry should be evicted"
+        assert stats['evictions'] == 1 and stats['hits'] == 1 and stats['bytes'] == 10
+        
+        filters = (dashboard.df['Manufacturer Name'].iloc[0], 'All', 'All', 'All', 'All', 'All', 2025, 'All')
+        first = update_charts(*filters)
+        hits = dashboard.figure_cache.hits
+        second = update_charts(*filters)
+        assert dashboard.figure_cache.hits == hits + 1, "Repeat view should be a cache hit"
+        assert [c.children.figure for c in first.children] == [c.children.figure for c in second.children]
+        
+        version = dashboard.dataset_version
+        dashboard.set_dataset(dashboard.df)
+        assert dashboard.dataset_version == version + 1
+        assert dashboard.figure_cache.stats()['entries'] == 0, "Reload should invalidate cached figures"
+        
+        print("✓ Figure cache test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing figure cache: {e}")
+        return False
+
+def test_server_side_table():
+    """Test server-side paging, sorting and filtering of the data table"""
+    print("\nTesting server-side data table...")
+    
+    try:
+        from comprehensive_dashboard import update_data_table, query_table_rows, _query_table_rows
+        
+        # Unsorted, table-unfiltered views reuse the selection and take no table cache space
+        cached = _query_table_rows.cache_info().currsize
+        data, page_count, _, title = update_data_table(*(('All',) * 8), 0, 20, [], '')
+        assert len(data) == 20 and isinstance(query_table_rows(('All',) * 8, (), '')[1], range)
+        assert _query_table_rows.cache_info().currsize == cached, "Identity results should not be cached"
+        
+        filters = ('All', 'All', 'All', 'All', 'All', 'All', 2025, 'All')
+        data, page_count, page_current, title = update_data_table(*filters, 0, 20, [], '')
+        assert len(data) == 20, "Only one page of rows should be sent"
+        assert page_count * 20 >= 312 > (page_count - 1) * 20, "Page count should cover every filtered row"
+        assert "312" in title, "Title should report the full result size"
+        
+        sort_by = [{'column_id': 'Monthly Sale Data (Units)', 'direction': 'desc'}]
+        data, _, _, _ = update_data_table(*filters, 0, 20, sort_by, '{Manufacturer Name} contains "Deere"')
+        assert all(row['Manufacturer Name'] == 'John Deere' for row in data), "Table filter should apply"
+        sales = [int(row['Monthly Sale Data (Units)'].split('-')[0]) for row in data]
+        assert sales == sorted(sales, reverse=True), "Rows should be sorted by sales"
+        
+        data, _, page_current, _ = update_data_table(*filters, 999, 20, [], '')
+        assert page_current == page_count - 1, "Out of range pages should clamp to the last page"
+        
+        print("✓ Server-side data table test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing server-side data table: {e}")
+        return False
+
 def test_export_functionality():
     """Test export functionality"""
     print("\nTesting export functionality...")
@@ -164,7 +555,7 @@ def test_export_functionality():
         df = create_comprehensive_dummy_data()
         
         # Test CSV export
-        filtered_df = apply_filters(df, 'John Deere', 'All', 'All', 'All', 'All', 'All', 'All', 'All', 'All', 'All', None, None)
+        filtered_df = apply_filters(df, 'John Deere', 'All', 'All', 'All', 'All', 'All', 'All', 'All')
         csv_string = filtered_df.to_csv(index=False)
         assert len(csv_string) > 0, "CSV export should not be empty"
         print("✓ CSV export test passed")
@@ -183,24 +574,548 @@ def test_export_functionality():
         print(f"✗ Error testing exports: {e}")
         return False
 
+def test_csv_export_route():
+    """Test the streaming CSV export route"""
+    print("\nTesting CSV export route...")
+    
+    try:
+        from comprehensive_dashboard import app, df, apply_filters, iter_csv, select_rows, with_display_columns
+        
+        client = app.server.test_client()
+        response = client.get('/export/csv?manufacturer=John+Deere&year=2024')
+        assert response.status_code == 200, "CSV export route should respond with 200"
+        assert 'attachment' in response.headers['Content-Disposition'], "CSV should be sent as an attachment"
+        
+        exported = pd.read_csv(io.BytesIO(response.data))
+        response.close()
+        expected = with_display_columns(apply_filters(df, 'John Deere', 'All', 'All', 'All', 'All', 'All', 2024, 'All'))
+        assert len(exported) == len(expected), "Exported rows should match the filtered data"
+        assert exported.columns.tolist() == expected.columns.tolist(), "Exported columns should match the dataset"
+        
+        # Chunked output should be identical to a single to_csv call
+        positions = select_rows('John Deere', 'All', 'All', 'All', 'All', 'All', 2024, 'All')
+        chunks = list(iter_csv(df, positions))
+        assert ''.join(chunks) == expected.to_csv(index=False), "Chunked CSV should match to_csv output"
+        
+        assert client.get('/export/csv?year=abc').status_code == 400, "Invalid year should be rejected"
+        
+        print("✓ CSV export route test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing CSV export route: {e}")
+        return False
+
+def test_excel_export_route():
+    """Test the Excel export route and sheet splitting"""
+    print("\nTesting Excel export route...")
+    
+    try:
+        from comprehensive_dashboard import app, df, apply_filters, write_excel
+        import openpyxl
+        
+        client = app.server.test_client()
+        response = client.get('/export/xlsx?manufacturer=Kubota+Corporation&month=4')
+        assert response.status_code == 200, "Excel export route should respond with 200"
+        assert int(response.headers['X-Export-Bytes']) == len(response.data), "Reported size should match the body"
+        
+        exported = pd.read_excel(io.BytesIO(response.data))
+        expected = apply_filters(df, 'Kubota Corporation', 'All', 'All', 'All', 'All', 'All', 'All', 4)
+        assert len(exported) == len(expected), "Exported rows should match the filtered data"
+        response.close()
+        
+        # Rows beyond the per-sheet limit continue on additional sheets
+        output = io.BytesIO()
+        rows_written = write_excel(df, None, output, sheet_rows=250)
+        workbook = openpyxl.load_workbook(output, read_only=True)
+        assert rows_written == len(df), "Every row should be written"
+        assert len(workbook.sheetnames) == -(-len(df) // 250), "Rows should be split across sheets"
+        print(f"✓ Excel split across {len(workbook.sheetnames)} sheets")
+        
+        print("✓ Excel export route test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing Excel export route: {e}")
+        return False
+
+def test_export_jobs():
+    """Test background export jobs: progress polling, the spooled file and TTL cleanup"""
+    print("\nTesting background export jobs...")
+    
+    import comprehensive_dashboard as dashboard
+    spool_dir = dashboard.EXPORT_SPOOL_DIR
+    try:
+        import os
+        import tempfile
+        import time
+        
+        dashboard.EXPORT_SPOOL_DIR = tempfile.mkdtemp()
+        client = dashboard.server.test_client()
+        
+        response = client.post('/export/jobs?format=xlsx&manufacturer=Kubota+Corporation&month=4')
+        assert response.status_code == 202
+        job = response.json
+        assert job['status'] == 'queued' and job['rows'] > 0
+        
+        for _ in range(100):
+            status = client.get(job['status_url']).json
+            if status['status'] in ('done', 'failed'):
+                break
+            time.sleep(0.1)
+        assert status['status'] == 'done', f"Job should finish, got {status}"
+        assert status['rows_written'] == job['rows'] and status['progress'] == 1.0
+        
+        response = client.get(status['file_url'])
+        assert response.status_code == 200
+        assert response.headers['Content-Disposition'].startswith('attachment')
+        exported = pd.read_excel(io.BytesIO(response.data))
+        response.close()
+        assert len(exported) == job['rows'], "Workbook should hold the filtered rows"
+        
+        assert client.post('/export/jobs?format=pdf').status_code == 400
+        assert client.get('/export/jobs/' + '0' * 32).status_code == 404
+        
+        assert dashboard.clean_spool(now=time.time() + dashboard.EXPORT_SPOOL_TTL_SECONDS + 1) > 0
+        assert not os.listdir(dashboard.EXPORT_SPOOL_DIR), "Expired jobs should be removed"
+        assert client.get(job['status_url']).status_code == 404
+        
+        print(f"✓ Background export job test passed ({job['rows']} rows)")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing background export jobs: {e}")
+        return False
+    finally:
+        dashboard.EXPORT_SPOOL_DIR = spool_dir
+
+def test_export_cache():
+    """Test the on-disk export cache: repeat downloads, conditional GETs and LRU eviction"""
+    print("\nTesting export cache...")
+    
+    import comprehensive_dashboard as dashboard
+    cache_dir, max_bytes = dashboard.export_cache.directory, dashboard.export_cache.max_bytes
+    try:
+        import os
+        import tempfile
+        
+        dashboard.export_cache.directory = tempfile.mkdtemp()
+        client = dashboard.server.test_client()
+        url = '/export/csv?manufacturer=Kubota+Corporation&year=2025'
+        
+        first = client.get(url)
+        assert first.status_code == 200 and first.headers['X-Export-Cache'] == 'miss'
+        body, etag = first.data, first.headers['ETag']  # reading the stream commits it to the cache
+        first.close()
+        second = client.get(url)
+        assert second.headers['X-Export-Cache'] == 'hit', "Repeat export should come from the cache"
+        assert second.data == body and second.headers['ETag'] == etag
+        second.close()
+        assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+        
+        other = client.get('/export/csv?manufacturer=Kubota+Corporation&year=2024')
+        assert other.data and other.headers['ETag'] != etag, "Different filters should have a different key"
+        other.close()
+        excel = client.get('/export/xlsx?manufacturer=Kubota+Corporation&year=2025')
+        assert excel.headers['X-Export-Cache'] == 'miss' and excel.headers['ETag'] != etag
+        excel.close()
+        excel = client.get('/export/xlsx?manufacturer=Kubota+Corporation&year=2025')
+        assert excel.headers['X-Export-Cache'] == 'hit'
+        excel.close()
+        assert dashboard.export_cache.stats()['entries'] == 3
+        
+        # Touch the first CSV so it is the most recently used, then shrink the budget to fit it alone
+        third = client.get(url)
+        assert third.data == body
+        third.close()
+        newest = dashboard.export_cache.path(etag.strip('"'), 'csv')
+        os.utime(newest, (os.path.getatime(newest), os.path.getmtime(newest) + 60))
+        dashboard.export_cache.max_bytes = os.path.getsize(newest)
+        dashboard.export_cache.evict()
+        assert os.listdir(dashboard.export_cache.directory) == [os.path.basename(newest)], \
+            "Least recently used exports should be evicted first"
+        
+        print("✓ Export cache test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing export cache: {e}")
+        return False
+    finally:
+        dashboard.export_cache.directory, dashboard.export_cache.max_bytes = cache_dir, max_bytes
+
+def test_compressed_and_columnar_exports():
+    """Test the gzip/zstd CSV, Parquet and Arrow IPC export routes"""
+    print("\nTesting compressed and columnar exports...")
+    
+    import comprehensive_dashboard as dashboard
+    cache_dir = dashboard.export_cache.directory
+    try:
+        import gzip
+        import tempfile
+        import pyarrow as pa
+        
+        dashboard.export_cache.directory = tempfile.mkdtemp()
+        client = dashboard.server.test_client()
+        query = '?manufacturer=Kubota+Corporation&year=2025'
+        response = client.get('/export/csv' + query)
+        csv = response.data
+        response.close()
+        expected = dashboard.apply_filters(dashboard.df, 'Kubota Corporation', 'All', 'All', 'All',
+                                           'All', 'All', 2025, 'All').reset_index(drop=True)
+        
+        response = client.get('/export/csv.gz' + query)
+        assert response.status_code == 200 and response.mimetype == 'application/gzip'
+        assert gzip.decompress(response.data) == csv, "gzip CSV should decompress to the CSV export"
+        response.close()
+        response = client.get('/export/csv.zst' + query)
+        assert pa.input_stream(io.BytesIO(response.data), compression='zstd').read() == csv, \
+            "zstd CSV should decompress to the CSV export"
+        response.close()
+        
+        for extension, read in (('parquet', pd.read_parquet), ('arrow', pd.read_feather)):
+            response = client.get(f'/export/{extension}' + query)
+            assert response.status_code == 200
+            assert 'attachment' in response.headers['Content-Disposition']
+            exported = read(io.BytesIO(response.data))
+            response.close()
+            assert exported.dtypes.equals(expected.dtypes), f"{extension} should keep the typed columns"
+            assert exported.equals(expected), f"{extension} rows should match the filtered data"
+        
+        empty = client.get('/export/parquet?year=1999')
+        assert len(pd.read_parquet(io.BytesIO(empty.data))) == 0, "An empty selection should still be readable"
+        empty.close()
+        assert client.get('/export/pdf').status_code == 404
+        
+        links = dashboard.update_export_links('Kubota Corporation', 'All', 'All', 'All', 'All', 'All', 2025, 'All')
+        assert '/export/parquet?manufacturer=Kubota+Corporation&year=2025' in links
+        
+        print("✓ Compressed and columnar export test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing compressed and columnar exports: {e}")
+        return False
+    finally:
+        dashboard.export_cache.directory = cache_dir
+
+def test_uncompacted_columnar_exports():
+    """Test Parquet and Arrow IPC exports of a frame loaded without the compact schema"""
+    print("\nTesting columnar exports of an uncompacted frame...")
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from comprehensive_dashboard import load_tractor_data, write_parquet, write_arrow
+        
+        frame = load_tractor_data(compact=False)
+        assert frame['Manufacturer Name'].dtype == object
+        
+        for positions in (None, np.arange(0, len(frame), 7), np.array([], dtype=np.int64)):
+            expected = frame if positions is None else frame.iloc[positions]
+            
+            output = io.BytesIO()
+            write_parquet(frame, positions, output)
+            output.seek(0)
+            table = pq.read_table(output)
+            assert table.num_rows == len(expected)
+            assert table.schema.field('Manufacturer Name').type == pa.string()
+            assert table.column('Manufacturer Name').to_pylist() == expected['Manufacturer Name'].tolist()
+            
+            output = io.BytesIO()
+            write_arrow(frame, positions, output)
+            output.seek(0)
+            table = pa.ipc.open_file(output).read_all()
+            assert table.num_rows == len(expected)
+            assert table.schema.field('Model Name').type == pa.string()
+            assert table.column('Model Name').to_pylist() == expected['Model Name'].tolist()
+        
+        print("✓ Uncompacted columnar export test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing uncompacted columnar exports: {e}")
+        return False
+
+def test_metrics_endpoint():
+    """Test per-callback metrics exposed on /metrics"""
+    print("\nTesting metrics endpoint...")
+    
+    try:
+        from comprehensive_dashboard import app, request_metrics
+        
+        client = app.server.test_client()
+        filter_ids = ['manufacturer-filter', 'brand-filter', 'model-filter', 'hp-segment-filter',
+                      'import-country-filter', 'destination-country-filter', 'year-filter', 'month-filter']
+        body = {
+            'output': 'summary-cards.children',
+            'outputs': {'id': 'summary-cards', 'property': 'children'},
+            'inputs': [{'id': i, 'property': 'value', 'value': 2025 if i == 'year-filter' else 'All'}
+                       for i in filter_ids],
+            'changedPropIds': ['year-filter.value']
+        }
+        before = request_metrics.snapshot().get('update_summary_cards', {'count': 0, 'bytes': 0})
+        response = client.post('/_dash-update-component', json=body)
+        assert response.status_code == 200
+        
+        after = request_metrics.snapshot()['update_summary_cards']
+        assert after['count'] == before['count'] + 1
+        assert after['bytes'] - before['bytes'] == len(response.data), "Response size should be recorded"
+        
+        response = client.get('/metrics')
+        text = response.get_data(as_text=True)
+        assert response.status_code == 200 and response.mimetype == 'text/plain'
+        assert '# TYPE dashboard_request_seconds histogram' in text
+        assert 'dashboard_request_seconds_count{handler="update_summary_cards"}' in text
+        assert 'dashboard_rows_selected_total{handler="update_summary_cards"}' in text
+        assert 'dashboard_figure_cache_hits_total' in text
+        assert 'dashboard_rollup_cache_bytes' in text
+        
+        # Metering a streamed body must still close it, as send_file bodies hold open files
+        import time
+        from comprehensive_dashboard import _metered
+        
+        class Body(list):
+            closed = False
+            def close(self):
+                self.closed = True
+        
+        streamed = Body([b'a', b'bc'])
+        assert b''.join(_metered(streamed, 'metered_body', time.perf_counter(), 0)) == b'abc'
+        assert streamed.closed, "The metered body should be closed"
+        
+        print("✓ Metrics endpoint test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing metrics endpoint: {e}")
+        return False
+
+def test_response_compression():
+    """Test gzip compression of callback responses and the slim chart template"""
+    print("\nTesting response compression...")
+    
+    try:
+        import gzip
+        import json
+        from comprehensive_dashboard import app, build_chart_figures, request_metrics, CHART_TEMPLATE_LAYOUT
+        
+        figures = build_chart_figures('All', 'All', 'All', 'All', 'All', 'All', 2025, 'All')
+        for figure in figures:
+            template = figure.layout.template.to_plotly_json()
+            assert set(template['layout']) <= set(CHART_TEMPLATE_LAYOUT), "Figures should carry the slim template"
+            assert 'scene' not in template['layout'] and 'surface' not in template.get('data', {})
+        
+        client = app.server.test_client()
+        filter_ids = ['manufacturer-filter', 'brand-filter', 'model-filter', 'hp-segment-filter',
+                      'import-country-filter', 'destination-country-filter', 'year-filter', 'month-filter']
+        body = {
+            'output': 'charts-container.children',
+            'outputs': {'id': 'charts-container', 'property': 'children'},
+            'inputs': [{'id': i, 'property': 'value', 'value': 2025 if i == 'year-filter' else 'All'}
+                       for i in filter_ids],
+            'changedPropIds': ['year-filter.value']
+        }
+        plain = client.post('/_dash-update-component', json=body)
+        assert 'Content-Encoding' not in plain.headers, "Clients without gzip should get plain JSON"
+        
+        before = request_metrics.snapshot()['update_charts']['saved']
+        compressed = client.post('/_dash-update-component', json=body, headers={'Accept-Encoding': 'gzip'})
+        assert compressed.status_code == 200 and compressed.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in compressed.headers['Vary']
+        assert json.loads(gzip.decompress(compressed.data)) == json.loads(plain.data), \
+            "Compressed response should decode to the same payload"
+        saved = request_metrics.snapshot()['update_charts']['saved'] - before
+        assert saved == len(plain.data) - len(compressed.data), "Bytes saved should be recorded"
+        assert 'dashboard_response_bytes_saved_total{handler="update_charts"}' in client.get('/metrics').get_data(as_text=True)
+        
+        small = client.get('/health', headers={'Accept-Encoding': 'gzip'})
+        assert 'Content-Encoding' not in small.headers, "Small responses should not be compressed"
+        
+        print(f"✓ Response compression test passed ({len(plain.data):,} -> {len(compressed.data):,} bytes)")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing response compression: {e}")
+        return False
+
+def test_benchmark_harness():
+    """Test the benchmark harness on a tiny dataset and its regression check"""
+    print("\nTesting benchmark harness...")
+    
+    try:
+        import comprehensive_dashboard as dashboard
+        from benchmark_comprehensive_dashboard import run_benchmarks, find_regressions
+        
+        rows_before = len(dashboard.df)
+        report = run_benchmarks(sizes=[2400], repeat=1)
+        assert len(dashboard.df) == rows_before, "The dashboard dataset should be restored"
+        
+        cases = {r['case'] for r in report['results']}
+        assert 'apply_filters[all]' in cases and 'update_charts[all]' in cases and 'export_csv[all]' in cases
+        assert all(r['seconds'] >= 0 for r in report['results'])
+        assert report['meta']['repeat'] == 1
+        
+        assert find_regressions(report, report) == [], "A run should not regress against itself"
+        faster = {'results': [dict(r, seconds=r['seconds'] / 10) for r in report['results']]}
+        assert find_regressions(report, faster), "A 10x slowdown should be flagged"
+        
+        print("✓ Benchmark harness test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing benchmark harness: {e}")
+        return False
+
+def test_cold_start():
+    """Test that importing is lazy and a cold process answers /health within budget"""
+    print("\nTesting cold start...")
+    
+    try:
+        from comprehensive_dashboard import profile_startup
+        
+        report = profile_startup()
+        assert report['health_status'] == 200
+        assert not report['loaded_at_import'], "Importing the module should not load the dataset"
+        assert report['first_health_seconds'] <= report['budget_seconds'], \
+            f"Cold start took {report['first_health_seconds']:.2f}s (budget {report['budget_seconds']:.2f}s)"
+        assert report['slowest_imports'], "Import profile should list modules"
+        
+        print(f"✓ Cold start test passed ({report['first_health_seconds']:.2f}s to first /health)")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing cold start: {e}")
+        return False
+
+def test_incremental_append():
+    """Test appending a month to the loaded dataset and the /admin/append route"""
+    print("\nTesting incremental append...")
+    
+    import comprehensive_dashboard as dashboard
+    previous = dashboard.get_data()
+    token, ingest_dir = dashboard.ADMIN_TOKEN, dashboard.INGEST_DIR
+    try:
+        import os
+        import tempfile
+        
+        version = dashboard.dataset_version
+        _, old_index, _ = dashboard.dataset_snapshot()
+        month = dashboard.create_comprehensive_dummy_data(np.random.default_rng(7), n_base_rows=50,
+                                                          start='2026-01', end='2026-01')
+        assert dashboard.append_rows(month) == len(month)
+        
+        # A selection finished against the old index after the swap must not answer for the new data
+        filters = ('All',) * 6 + (2026, 'All')
+        assert dashboard.select_index_rows(old_index, filters) is not None
+        frame, positions, _ = dashboard.select_snapshot(*filters)
+        assert frame is dashboard.df and len(positions) == len(month), "Stale positions were served"
+        assert len(dashboard.df) == len(previous) + len(month)
+        assert dashboard.dataset_version == version + 1, "Appending should bump the dataset version"
+        assert 2026 in dashboard.filter_options['Year'], "The new year should be offered"
+        
+        fresh = dashboard.FilterIndex(dashboard.df)
+        for filters in [('All',) * 6 + (2026, 1), ('All',) * 6 + (2025, 'All'),
+                        (str(month['Manufacturer Name'].iloc[0]),) + ('All',) * 5 + ('All', 1)]:
+            assert np.array_equal(dashboard.filter_index.select(*filters), fresh.select(*filters)), \
+                f"Extended index should match a rebuilt one for {filters}"
+        # The roll-ups built before the append were merged, and match rebuilt ones
+        for dimensions in (dashboard.CARD_DIMENSIONS, dashboard.CHART_DIMENSIONS):
+            keys = [column for column in dashboard.CUBE_KEYS if column in dimensions]
+            merged = dashboard.rollups.cube(dimensions).set_index(keys).sort_index()
+            rebuilt = dashboard.build_cube(dashboard.df, keys).set_index(keys).sort_index()
+            assert len(merged) == len(rebuilt) and merged['Rows'].sum() == len(dashboard.df)
+            assert np.allclose(merged['Sales_Min_sum'], rebuilt['Sales_Min_sum'])
+        
+        dashboard.ADMIN_TOKEN, dashboard.INGEST_DIR = 'secret', tempfile.mkdtemp()
+        extract = pd.read_csv('last_sheet_clean.csv', dtype=str).head(8).assign(Month='2', Year='2026')
+        body = extract.to_csv(index=False).encode()
+        client = dashboard.server.test_client()
+        assert client.post('/admin/append', data=body).status_code == 401
+        response = client.post('/admin/append', data=body, headers={'Authorization': 'Bearer secret'})
+        assert response.status_code == 200, response.get_data(as_text=True)
+        assert response.json['rows_added'] > 0 and response.json['rows'] == len(dashboard.df)
+        assert client.post('/admin/append', data=body,
+                           headers={'Authorization': 'Bearer secret'}).status_code == 409, \
+            "The same extract should not be appended twice"
+        other = extract.head(3).to_csv(index=False).encode()
+        refused = client.post('/admin/append', data=other, headers={'Authorization': 'Bearer secret'})
+        assert refused.status_code == 409 and '2026-02' in refused.json['error'], \
+            "A different extract for a month already loaded should be refused"
+        assert len(os.listdir(dashboard.INGEST_DIR)) == 1, "Refused extracts should not be stored"
+        
+        print(f"✓ Incremental append test passed ({len(month)} + {response.json['rows_added']} rows appended)")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error testing incremental append: {e}")
+        return False
+    finally:
+        dashboard.ADMIN_TOKEN, dashboard.INGEST_DIR = token, ingest_dir
+        dashboard.set_dataset(previous)
+
 if __name__ == "__main__":
     print("Comprehensive Tractor Dashboard - Component Test")
     print("=" * 60)
     
     # Run all tests
     data_test = test_comprehensive_data_creation()
+    seeded_test = test_seeded_data_generation()
+    loader_test = test_csv_data_loader()
+    compact_test = test_compact_schema()
     filter_test = test_filter_functionality()
+    index_test = test_filter_index()
+    cube_test = test_aggregate_cube()
+    card_cells_test = test_card_cells()
+    hierarchy_test = test_option_hierarchy()
     chart_test = test_chart_creation()
+    monthly_chart_test = test_monthly_sales_chart()
+    scatter_test = test_scatter_downsampling()
+    figure_cache_test = test_figure_cache()
+    table_test = test_server_side_table()
     export_test = test_export_functionality()
+    csv_route_test = test_csv_export_route()
+    excel_route_test = test_excel_export_route()
+    export_jobs_test = test_export_jobs()
+    export_cache_test = test_export_cache()
+    columnar_test = test_compressed_and_columnar_exports()
+    uncompacted_columnar_test = test_uncompacted_columnar_exports()
+    metrics_test = test_metrics_endpoint()
+    compression_test = test_response_compression()
+    benchmark_test = test_benchmark_harness()
+    cold_start_test = test_cold_start()
+    append_test = test_incremental_append()
     
     print("\n" + "=" * 60)
     print("Test Results:")
     print(f"Data Creation: {'✓ PASS' if data_test else '✗ FAIL'}")
+    print(f"Seeded Data Generation: {'✓ PASS' if seeded_test else '✗ FAIL'}")
+    print(f"CSV Data Loader: {'✓ PASS' if loader_test else '✗ FAIL'}")
+    print(f"Compact Schema: {'✓ PASS' if compact_test else '✗ FAIL'}")
     print(f"Filter Functionality: {'✓ PASS' if filter_test else '✗ FAIL'}")
+    print(f"Filter Index: {'✓ PASS' if index_test else '✗ FAIL'}")
+    print(f"Aggregate Cube: {'✓ PASS' if cube_test else '✗ FAIL'}")
+    print(f"Summary Card Cells: {'✓ PASS' if card_cells_test else '✗ FAIL'}")
+    print(f"Option Hierarchy: {'✓ PASS' if hierarchy_test else '✗ FAIL'}")
     print(f"Chart Creation: {'✓ PASS' if chart_test else '✗ FAIL'}")
+    print(f"Monthly Sales Chart: {'✓ PASS' if monthly_chart_test else '✗ FAIL'}")
+    print(f"Scatter Downsampling: {'✓ PASS' if scatter_test else '✗ FAIL'}")
+    print(f"Figure Cache: {'✓ PASS' if figure_cache_test else '✗ FAIL'}")
+    print(f"Server-side Data Table: {'✓ PASS' if table_test else '✗ FAIL'}")
     print(f"Export Functionality: {'✓ PASS' if export_test else '✗ FAIL'}")
+    print(f"CSV Export Route: {'✓ PASS' if csv_route_test else '✗ FAIL'}")
+    print(f"Excel Export Route: {'✓ PASS' if excel_route_test else '✗ FAIL'}")
+    print(f"Background Export Jobs: {'✓ PASS' if export_jobs_test else '✗ FAIL'}")
+    print(f"Export Cache: {'✓ PASS' if export_cache_test else '✗ FAIL'}")
+    print(f"Compressed and Columnar Exports: {'✓ PASS' if columnar_test else '✗ FAIL'}")
+    print(f"Uncompacted Columnar Exports: {'✓ PASS' if uncompacted_columnar_test else '✗ FAIL'}")
+    print(f"Metrics Endpoint: {'✓ PASS' if metrics_test else '✗ FAIL'}")
+    print(f"Response Compression: {'✓ PASS' if compression_test else '✗ FAIL'}")
+    print(f"Benchmark Harness: {'✓ PASS' if benchmark_test else '✗ FAIL'}")
+    print(f"Cold Start: {'✓ PASS' if cold_start_test else '✗ FAIL'}")
+    print(f"Incremental Append: {'✓ PASS' if append_test else '✗ FAIL'}")
     
-    if all([data_test, filter_test, chart_test, export_test]):
+    if all([data_test, seeded_test, loader_test, compact_test, filter_test, index_test, cube_test, card_cells_test, hierarchy_test, chart_test, monthly_chart_test, scatter_test, figure_cache_test, table_test, export_test, csv_route_test, excel_route_test, export_jobs_test, export_cache_test, columnar_test, uncompacted_columnar_test, metrics_test, compression_test, benchmark_test, cold_start_test, append_test]):
         print("\n🎉 All tests passed! Comprehensive dashboard is ready to run.")
         print("Run 'python comprehensive_dashboard.py' to start the dashboard.")
         print("Dashboard will be available at: http://localhost:8050")